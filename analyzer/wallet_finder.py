@@ -18,6 +18,7 @@ Think of it like detective work:
 """
 
 import asyncio
+import json
 from datetime import datetime, timezone
 from collections import defaultdict
 from typing import Any
@@ -71,7 +72,7 @@ class WalletFinder:
         if self.session:
             await self.session.close()
         if self.gmgn:
-            self.gmgn.close()
+            await self.gmgn.close()
 
     async def find_smart_wallets(self, tokens: list[dict]) -> dict[str, list[dict]]:
         """
@@ -169,6 +170,14 @@ class WalletFinder:
             for addr, trades in multi_token_wallets.items():
                 stats = gmgn_stats.get(addr, {})
                 if stats:
+                    # GMGN sometimes returns tags as a JSON string — normalize to a
+                    # list here so the database layer can trust the type
+                    tags = stats.get("tags") or []
+                    if isinstance(tags, str):
+                        try:
+                            tags = json.loads(tags)
+                        except (ValueError, TypeError):
+                            tags = []
                     # Attach GMGN stats to all trade records for this wallet
                     for trade in trades:
                         trade["gmgn_realized_profit"] = stats.get("realized_profit") or 0
@@ -179,7 +188,7 @@ class WalletFinder:
                         trade["gmgn_sell_30d"] = stats.get("sell_30d") or 0
                         trade["gmgn_sol_balance"] = stats.get("sol_balance") or 0
                         trade["gmgn_winrate"] = stats.get("winrate")
-                        trade["gmgn_tags"] = stats.get("tags") or []
+                        trade["gmgn_tags"] = tags
 
         return multi_token_wallets
 
@@ -28,11 +28,14 @@ from datetime import datetime, timezone
 
 from config.settings import Settings
 from database.db import Database
-from discovery.gmgn_client import GMGNClient
+from discovery.gmgn_client import SNIPER_PLATFORMS, GMGNClient
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# GMGN tags that mark a wallet as a bot
+BOT_TAGS = frozenset({"sandwich_bot", "sniper_bot", "mev_bot", "copy_bot", "arb_bot"})
+
 
 class WalletRefresher:
     """
@@ -81,7 +84,7 @@ class WalletRefresher:
                 min_sol_balance=self.settings.sm_min_sol_balance,
             )
         finally:
-            gmgn.close()
+            await gmgn.close()
 
         if not fresh_wallets:
             logger.warning("wallet_refresh_no_wallets", note="GMGN returned no wallets — check cookies")
@@ -93,9 +96,8 @@ class WalletRefresher:
         # Bot detection: GMGN tags are primary signal (most reliable),
         # raw trade frequency is secondary (200+/day = clearly automated).
         # Real degens easily do 50-150 trades/day — that's human behavior.
-        BOT_TAGS = {"sandwich_bot", "sniper_bot", "mev_bot", "copy_bot", "arb_bot"}
-        # Sniper bot platforms — profitable but uncopyable (millisecond entries)
-        SNIPER_PLATFORMS = {"axiom", "photon", "bullx"}
+        # Sniper bot platforms (SNIPER_PLATFORMS) are profitable but
+        # uncopyable (millisecond entries).
 
         for w in fresh_wallets:
             buy_30d = w.get("gmgn_buy_30d", 0) or 0
@@ -276,6 +276,20 @@ class Settings:
         default_factory=lambda: _get_env_int("SM_AUTO_MONITOR_TOP", 20)
     )
 
+    # =========================================================================
+    # GMGN Request Pacing
+    # =========================================================================
+
+    # Max GMGN requests in flight at once during bulk wallet enrichment
+    gmgn_max_concurrency: int = field(
+        default_factory=lambda: _get_env_int("GMGN_MAX_CONCURRENCY", 8)
+    )
+
+    # Pause (seconds) each in-flight slot takes after a request — keeps us polite
+    gmgn_request_interval: float = field(
+        default_factory=lambda: _get_env_float("GMGN_REQUEST_INTERVAL", 0.5)
+    )
+
     # =========================================================================
     # Wallet Refresh Cycle (Session 9 — Living Wallet Pool)
     # =========================================================================
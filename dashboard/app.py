@@ -67,7 +67,7 @@ async def run_db_migrations():
         ("wallets", "gmgn_sell_30d", "INTEGER DEFAULT 0"),
         ("wallets", "gmgn_tags", "TEXT"),
         ("wallets", "source", "TEXT DEFAULT 'manual'"),
-        ("wallets", "is_bot_speed", "BOOLEAN DEFAULT FALSE"),
+        ("wallets", "is_bot_speed", "INTEGER DEFAULT 0 CHECK (is_bot_speed IN (0, 1))"),
         ("positions", "signal_source_type", "TEXT DEFAULT 'human'"),
         ("agent_decisions", "outcome_multiplier", "REAL"),
     ]
@@ -84,7 +84,7 @@ async def run_db_migrations():
             pnl_7d_usd REAL DEFAULT 0,
             pnl_30d_usd REAL DEFAULT 0,
             pnl_all_time_usd REAL DEFAULT 0,
-            is_tracked BOOLEAN DEFAULT TRUE,
+            is_tracked INTEGER DEFAULT 1 CHECK (is_tracked IN (0, 1)),
             notes TEXT,
             first_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
@@ -103,7 +103,7 @@ async def run_db_migrations():
             avg_wallet_score REAL DEFAULT 0,
             market_cap_usd REAL,
             liquidity_usd REAL,
-            executed BOOLEAN DEFAULT FALSE,
+            executed INTEGER DEFAULT 0 CHECK (executed IN (0, 1)),
             trade_id INTEGER,
             amount_sol REAL DEFAULT 0,
             outcome_pnl_sol REAL,
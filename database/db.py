@@ -13,18 +13,136 @@ Every function here is a clean interface to the database.
 Other modules never write raw SQL — they call these functions instead.
 """
 
+import asyncio
 import json
+import sqlite3
+import threading
 from datetime import datetime, timezone
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any
 
 import aiosqlite
+import orjson
 
-from database.models import CREATE_TABLES_SQL
+from database.models import CREATE_TABLES_SQL, SCHEMA_VERSION, TokenRow
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# INSERT ... RETURNING landed in SQLite 3.35 — older builds fall back to lastrowid
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35)
+
+# Per-connection tuning applied to the writer and every reader:
+# temp B-trees in RAM, ~64MB page cache, and 256MB of memory-mapped reads
+_CONNECTION_PRAGMAS = """
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-64000;
+    PRAGMA mmap_size=268435456;
+"""
+
+# sqlite3 keeps prepared statements per connection, keyed by SQL text.
+# The default of 128 is close to the number of distinct statements in this
+# module once the IN (...) batch queries are counted; keep hot upserts from
+# being evicted and re-prepared.
+_STATEMENT_CACHE_SIZE = 512
+
+# Upserts shared by the single-row and bulk paths
+_UPSERT_TOKEN_SQL = """
+    INSERT INTO tokens (
+        mint_address, symbol, name, market_cap_usd, price_usd,
+        price_change_pct, price_multiplier, volume_24h_usd,
+        liquidity_usd, holder_count, pair_address, dex_name, data_source
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(mint_address) DO UPDATE SET
+        market_cap_usd = excluded.market_cap_usd,
+        price_usd = excluded.price_usd,
+        price_change_pct = excluded.price_change_pct,
+        price_multiplier = excluded.price_multiplier,
+        volume_24h_usd = excluded.volume_24h_usd,
+        liquidity_usd = excluded.liquidity_usd,
+        holder_count = excluded.holder_count
+"""
+
+_UPSERT_WALLET_SQL = """
+    INSERT INTO wallets (
+        address, total_score, pnl_score, win_rate_score, timing_score,
+        consistency_score, total_pnl_sol, total_trades, winning_trades,
+        win_rate, avg_entry_rank, unique_winners,
+        gmgn_realized_profit_usd, gmgn_profit_30d_usd, gmgn_sol_balance,
+        gmgn_winrate, gmgn_buy_30d, gmgn_sell_30d, gmgn_tags,
+        source, is_flagged, flag_reason, is_monitored, last_active, score_updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(address) DO UPDATE SET
+        total_score = excluded.total_score,
+        pnl_score = excluded.pnl_score,
+        win_rate_score = excluded.win_rate_score,
+        timing_score = excluded.timing_score,
+        consistency_score = excluded.consistency_score,
+        total_pnl_sol = excluded.total_pnl_sol,
+        total_trades = excluded.total_trades,
+        winning_trades = excluded.winning_trades,
+        win_rate = excluded.win_rate,
+        avg_entry_rank = excluded.avg_entry_rank,
+        unique_winners = excluded.unique_winners,
+        gmgn_realized_profit_usd = excluded.gmgn_realized_profit_usd,
+        gmgn_profit_30d_usd = excluded.gmgn_profit_30d_usd,
+        gmgn_sol_balance = excluded.gmgn_sol_balance,
+        gmgn_winrate = excluded.gmgn_winrate,
+        gmgn_buy_30d = excluded.gmgn_buy_30d,
+        gmgn_sell_30d = excluded.gmgn_sell_30d,
+        gmgn_tags = excluded.gmgn_tags,
+        source = excluded.source,
+        is_flagged = excluded.is_flagged,
+        flag_reason = excluded.flag_reason,
+        is_monitored = excluded.is_monitored,
+        last_active = excluded.last_active,
+        score_updated_at = excluded.score_updated_at
+"""
+
+_UPSERT_FOMO_TRADER_SQL = """
+    INSERT INTO fomo_traders (
+        wallet_address, username, twitter_handle, platform,
+        ranking, pnl_24h_usd, pnl_7d_usd, pnl_30d_usd,
+        pnl_all_time_usd, is_tracked, notes, last_updated
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(wallet_address) DO UPDATE SET
+        username = excluded.username,
+        twitter_handle = excluded.twitter_handle,
+        ranking = excluded.ranking,
+        pnl_24h_usd = excluded.pnl_24h_usd,
+        pnl_7d_usd = excluded.pnl_7d_usd,
+        pnl_30d_usd = excluded.pnl_30d_usd,
+        pnl_all_time_usd = excluded.pnl_all_time_usd,
+        notes = COALESCE(excluded.notes, fomo_traders.notes),
+        last_updated = excluded.last_updated
+"""
+
+
+def _table_schema(table: str) -> tuple[str, list[str]]:
+    """
+    The CREATE TABLE statement for `table` from CREATE_TABLES_SQL, and the
+    CREATE INDEX statements on it, each as a single statement.
+    """
+    create_table = None
+    create_indexes = []
+    statement = ""
+    for line in CREATE_TABLES_SQL.splitlines(keepends=True):
+        statement += line
+        if not sqlite3.complete_statement(statement):
+            continue
+        sql = statement.strip()
+        statement = ""
+        # Whole-line comments only, so a statement starts with its keyword
+        body = "\n".join(l for l in sql.splitlines() if not l.lstrip().startswith("--")).strip()
+        if body.startswith(f"CREATE TABLE IF NOT EXISTS {table} ("):
+            create_table = body
+        elif body.startswith("CREATE INDEX") and f" ON {table}(" in body:
+            create_indexes.append(body)
+    if create_table is None:
+        raise ValueError(f"no CREATE TABLE for {table} in the schema")
+    return create_table, create_indexes
 
 class Database:
     """
@@ -37,9 +155,34 @@ class Database:
         await db.close()
     """
 
-    def __init__(self, db_path: str):
+    # How often the background task refreshes query planner statistics
+    OPTIMIZE_INTERVAL_SECONDS = 15 * 60
+    # Max bound parameters per IN (...) batch — stays under SQLite's 999 limit
+    SQL_PARAM_CHUNK = 900
+    # Tables stored WITHOUT ROWID (see models.py)
+    WITHOUT_ROWID_TABLES = ("wallet_token_trades", "wallet_cluster_members", "daily_stats")
+
+    def __init__(self, db_path: str, read_pool_size: int = 4):
         self.db_path = db_path
+        # Single writer connection — SQLite only ever allows one writer anyway.
+        # Other modules that need raw SQL go through this one.
         self.connection: aiosqlite.Connection | None = None
+        # Small pool of read-only connections. Under WAL, readers don't block
+        # the writer (and vice versa), so SELECTs from the monitor loop no
+        # longer queue up behind executor commits on the shared connection.
+        self.read_pool_size = read_pool_size
+        self._readers: list[aiosqlite.Connection] = []
+        # Idle readers; a query takes one out and puts it back when done
+        self._reader_pool: asyncio.Queue[aiosqlite.Connection] | None = None
+        # Plain sqlite3 read-only connection for the hottest pre-trade checks.
+        # Each query runs execute+fetch in one thread hop instead of two.
+        self._hot_reader: sqlite3.Connection | None = None
+        self._hot_lock = threading.Lock()
+        self._optimize_task: asyncio.Task | None = None
+        # Every wallet_address in fomo_traders, loaded once at startup and kept
+        # in step by the upserts. Rows are never deleted, so the set only grows.
+        # Membership checks in discovery then never touch the database.
+        self._known_fomo: set[str] | None = None
 
     async def initialize(self) -> None:
         """
@@ -49,20 +192,186 @@ class Database:
         # Make sure the directory for the database file exists
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
 
-        self.connection = await aiosqlite.connect(self.db_path)
+        self.connection = await aiosqlite.connect(
+            self.db_path, cached_statements=_STATEMENT_CACHE_SIZE
+        )
         # Enable WAL mode for better concurrent read/write performance
-        await self.connection.execute("PRAGMA journal_mode=WAL")
+        cursor = await self.connection.execute("PRAGMA journal_mode=WAL")
+        row = await cursor.fetchone()
+        if not row or str(row[0]).lower() != "wal":
+            # e.g. network filesystems — still works, just without concurrent reads
+            logger.warning("database_wal_unavailable", journal_mode=row[0] if row else None)
+        # Under WAL, NORMAL only fsyncs at checkpoint time and is still crash-safe
+        await self.connection.execute("PRAGMA synchronous=NORMAL")
+        await self.connection.executescript(_CONNECTION_PRAGMAS)
+        # Checkpoint less often than the 1000-page default — with a commit per
+        # row that default fires constantly. checkpoint() trims the file instead.
+        await self.connection.execute("PRAGMA wal_autocheckpoint=10000")
         # Return rows as dictionaries instead of tuples (much easier to work with)
         self.connection.row_factory = aiosqlite.Row
 
-        # Create all tables (IF NOT EXISTS means it's safe to run multiple times)
-        await self.connection.executescript(CREATE_TABLES_SQL)
+        # Schema setup only runs when the file is new or behind the code's
+        # SCHEMA_VERSION — a warm start skips re-parsing the whole script
+        cursor = await self.connection.execute("PRAGMA user_version")
+        row = await cursor.fetchone()
+        if not row or row[0] != SCHEMA_VERSION:
+            # Create all tables (IF NOT EXISTS means it's safe to run multiple times)
+            await self.connection.executescript(CREATE_TABLES_SQL)
+            await self.connection.commit()
+
+            # Older databases still have rowid versions of the keyed tables
+            await self._rebuild_without_rowid_tables()
+
+            # Migrate existing databases — add new columns if they don't exist yet
+            await self._run_migrations()
+
+            await self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            await self.connection.commit()
+            logger.info("database_schema_applied", version=SCHEMA_VERSION)
+
+        # Open the read-only connections last, once the schema exists
+        await self._open_readers()
+
+        rows = await self._fetchall("SELECT wallet_address FROM fomo_traders")
+        self._known_fomo = {row[0] for row in rows}
+
+        # Keep query planner statistics fresh as tables grow
+        self._optimize_task = asyncio.create_task(self._optimize_loop())
+
+        logger.info("database_initialized", path=self.db_path, readers=len(self._readers))
+
+    async def _open_readers(self) -> None:
+        """Open the pool of read-only connections used for SELECT queries."""
+        uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+        for _ in range(self.read_pool_size):
+            reader = await aiosqlite.connect(uri, uri=True, cached_statements=_STATEMENT_CACHE_SIZE)
+            # Belt and braces: mode=ro already refuses writes, query_only makes
+            # any accidental write fail loudly instead of silently contending
+            await reader.execute("PRAGMA query_only=ON")
+            await reader.executescript(_CONNECTION_PRAGMAS)
+            reader.row_factory = aiosqlite.Row
+            self._readers.append(reader)
+
+        self._reader_pool = asyncio.Queue()
+        for reader in self._readers:
+            self._reader_pool.put_nowait(reader)
+
+        self._hot_reader = sqlite3.connect(
+            uri, uri=True, check_same_thread=False, cached_statements=_STATEMENT_CACHE_SIZE
+        )
+        self._hot_reader.execute("PRAGMA query_only=ON")
+        self._hot_reader.executescript(_CONNECTION_PRAGMAS)
+        self._hot_reader.row_factory = sqlite3.Row
+
+    async def _optimize_loop(self) -> None:
+        """
+        Run PRAGMA optimize every 15 minutes, then checkpoint the WAL.
+        Keeps the planner's statistics current so joins like get_side_wallets
+        don't drift onto bad plans as the tables grow, and keeps the -wal file
+        from growing without bound under sustained writes.
+        """
+        while True:
+            await asyncio.sleep(self.OPTIMIZE_INTERVAL_SECONDS)
+            try:
+                await self.connection.execute("PRAGMA optimize")
+            except Exception as e:
+                logger.warning("database_optimize_failed", error=str(e))
+            await self.checkpoint()
+
+    async def checkpoint(self) -> None:
+        """
+        Fold the WAL back into the main database file and truncate it.
+        Run on the maintenance schedule and after large bulk writes.
+        """
+        try:
+            cursor = await self.connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            row = await cursor.fetchone()
+            # (busy, wal_pages, checkpointed_pages) — busy=1 means a reader held it back
+            if row and row[0]:
+                logger.debug("database_checkpoint_busy", wal_pages=row[1], checkpointed=row[2])
+        except Exception as e:
+            logger.warning("database_checkpoint_failed", error=str(e))
+
+    async def _run_write(self, sql: str, params: tuple = ()) -> int:
+        """
+        Run one write statement on the writer and commit. Returns the rowcount.
+        Every single-statement UPDATE/upsert goes through here so the writer
+        path lives in one place.
+        """
+        cursor = await self.connection.execute(sql, params)
+        await self.connection.commit()
+        return cursor.rowcount
+
+    async def _run_many(self, sql: str, rows: list[tuple]) -> None:
+        """
+        Run one write statement for many parameter rows in a single transaction.
+        Rolls back on error so a half-written batch never lingers on the writer.
+        """
+        try:
+            await self.connection.executemany(sql, rows)
+            await self.connection.commit()
+        except Exception:
+            await self.connection.rollback()
+            raise
+
+    async def _insert(self, sql: str, params: tuple) -> int:
+        """
+        Run an INSERT (or upsert) on the writer, commit, and return the row's id.
+        With RETURNING the id comes back with the statement itself, and it is
+        also correct for upserts that hit the UPDATE branch.
+        """
+        if _HAS_RETURNING:
+            cursor = await self.connection.execute(f"{sql.rstrip()} RETURNING id", params)
+            row = await cursor.fetchone()
+            await self.connection.commit()
+            return row[0] if row else cursor.lastrowid
+        cursor = await self.connection.execute(sql, params)
         await self.connection.commit()
+        return cursor.lastrowid
 
-        # Migrate existing databases — add new columns if they don't exist yet
-        await self._run_migrations()
+    async def _hot_fetchone(self, sql: str, params: tuple = ()) -> sqlite3.Row | tuple | None:
+        """
+        Run a single-row SELECT on the plain sqlite3 reader in one worker-thread hop.
+        Used only for the small queries that fire on every executor/monitor tick.
+        """
+        if self._hot_reader is None:
+            return await self._fetchone(sql, params)
+
+        def _fetch():
+            # The connection is shared across to_thread workers — one query at a time
+            with self._hot_lock:
+                return self._hot_reader.execute(sql, params).fetchone()
 
-        logger.info("database_initialized", path=self.db_path)
+        return await asyncio.to_thread(_fetch)
+
+    @asynccontextmanager
+    async def _reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """
+        Check a read connection out of the pool for the duration of the block.
+        Each query gets a connection to itself instead of queueing behind
+        another query on a shared one. Falls back to the writer if the pool
+        isn't open yet.
+        """
+        if self._reader_pool is None:
+            yield self.connection
+            return
+        reader = await self._reader_pool.get()
+        try:
+            yield reader
+        finally:
+            self._reader_pool.put_nowait(reader)
+
+    async def _fetchall(self, sql: str, params: tuple = ()) -> list[aiosqlite.Row]:
+        """Run a SELECT on a pooled reader and return all rows."""
+        async with self._reader() as reader:
+            cursor = await reader.execute(sql, params)
+            return await cursor.fetchall()
+
+    async def _fetchone(self, sql: str, params: tuple = ()) -> aiosqlite.Row | None:
+        """Run a SELECT on a pooled reader and return the first row (or None)."""
+        async with self._reader() as reader:
+            cursor = await reader.execute(sql, params)
+            return await cursor.fetchone()
 
     async def _run_migrations(self) -> None:
         """Add new columns to existing tables. Safe to run multiple times."""
@@ -77,7 +386,7 @@ class Database:
             ("wallets", "gmgn_tags", "TEXT"),
             ("wallets", "source", "TEXT DEFAULT 'manual'"),
             # Session 9: bot speed tagging + wallet-type exit rules
-            ("wallets", "is_bot_speed", "BOOLEAN DEFAULT FALSE"),
+            ("wallets", "is_bot_speed", "INTEGER DEFAULT 0 CHECK (is_bot_speed IN (0, 1))"),
             ("positions", "signal_source_type", "TEXT DEFAULT 'human'"),
             # Agent decision outcome columns (Session 8)
             ("agent_decisions", "outcome_multiplier", "REAL"),
@@ -91,9 +400,59 @@ class Database:
                 pass  # Column already exists — that's fine
         await self.connection.commit()
 
+    async def _rebuild_without_rowid_tables(self) -> None:
+        """
+        Convert pre-WITHOUT ROWID copies of WITHOUT_ROWID_TABLES in place.
+        Legacy tables are renamed, recreated from the schema, copied across
+        (later rows win on a duplicate key, same as the upserts), then dropped.
+        It all happens in one explicit transaction, statement by statement —
+        executescript() would commit the renames before the copy — so a crash
+        part-way leaves the old tables untouched for the next start to retry.
+        """
+        legacy = []
+        for table in self.WITHOUT_ROWID_TABLES:
+            cursor = await self.connection.execute(f"PRAGMA table_info({table})")
+            columns = [row[1] for row in await cursor.fetchall()]
+            if "id" in columns:
+                legacy.append((table, [c for c in columns if c != "id"]))
+        if not legacy:
+            return
+
+        await self.connection.execute("BEGIN")
+        try:
+            for table, columns in legacy:
+                create_table, create_indexes = _table_schema(table)
+                await self.connection.execute(f"ALTER TABLE {table} RENAME TO {table}_legacy")
+                await self.connection.execute(create_table)
+                cols = ", ".join(columns)
+                await self.connection.execute(
+                    f"INSERT OR REPLACE INTO {table} ({cols}) SELECT {cols} FROM {table}_legacy ORDER BY id"
+                )
+                # The indexes went with the legacy table; recreate them on the new one
+                await self.connection.execute(f"DROP TABLE {table}_legacy")
+                for sql in create_indexes:
+                    await self.connection.execute(sql)
+            await self.connection.commit()
+        except Exception:
+            await self.connection.rollback()
+            raise
+        logger.info("without_rowid_tables_rebuilt", tables=[t for t, _ in legacy])
+
     async def close(self) -> None:
-        """Close the database connection cleanly."""
+        """Close the database connections cleanly."""
+        if self._optimize_task:
+            self._optimize_task.cancel()
+            self._optimize_task = None
+        self._reader_pool = None
+        for reader in self._readers:
+            await reader.close()
+        self._readers = []
+        if self._hot_reader is not None:
+            self._hot_reader.close()
+            self._hot_reader = None
         if self.connection:
+            # Let SQLite refresh planner statistics based on this session's queries
+            await self.connection.execute("PRAGMA optimize")
             await self.connection.close()
             logger.info("database_closed")
 
@@ -101,7 +460,7 @@ class Database:
     # Token Operations (Stage 1: Discovery)
     # =========================================================================
 
-    async def insert_token(self, token_data: dict[str, Any]) -> int:
+    async def insert_token(self, token_data: TokenRow | dict[str, Any]) -> int:
         """
         Save a discovered token to the database.
         Returns the token's database ID.
@@ -109,38 +468,24 @@ class Database:
         If the token already exists (same mint address), it updates the record
         instead of creating a duplicate.
         """
-        sql = """
-            INSERT INTO tokens (
-                mint_address, symbol, name, market_cap_usd, price_usd,
-                price_change_pct, price_multiplier, volume_24h_usd,
-                liquidity_usd, holder_count, pair_address, dex_name, data_source
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(mint_address) DO UPDATE SET
-                market_cap_usd = excluded.market_cap_usd,
-                price_usd = excluded.price_usd,
-                price_change_pct = excluded.price_change_pct,
-                price_multiplier = excluded.price_multiplier,
-                volume_24h_usd = excluded.volume_24h_usd,
-                liquidity_usd = excluded.liquidity_usd,
-                holder_count = excluded.holder_count
-        """
-        cursor = await self.connection.execute(sql, (
-            token_data.get("mint_address"),
-            token_data.get("symbol"),
-            token_data.get("name"),
-            token_data.get("market_cap_usd"),
-            token_data.get("price_usd"),
-            token_data.get("price_change_pct"),
-            token_data.get("price_multiplier"),
-            token_data.get("volume_24h_usd"),
-            token_data.get("liquidity_usd"),
-            token_data.get("holder_count"),
-            token_data.get("pair_address"),
-            token_data.get("dex_name"),
-            token_data.get("data_source"),
-        ))
-        await self.connection.commit()
-        return cursor.lastrowid
+        if not isinstance(token_data, TokenRow):
+            token_data = TokenRow.from_dict(token_data)
+        return await self._insert(_UPSERT_TOKEN_SQL, token_data.as_params())
+
+    async def insert_tokens_bulk(self, tokens: list[TokenRow | dict[str, Any]]) -> int:
+        """
+        Save many discovered tokens in one transaction (one commit, one fsync).
+        Same semantics as calling insert_token for each; returns how many
+        rows were written.
+        """
+        if not tokens:
+            return 0
+        rows = [
+            (t if isinstance(t, TokenRow) else TokenRow.from_dict(t)).as_params()
+            for t in tokens
+        ]
+        await self._run_many(_UPSERT_TOKEN_SQL, rows)
+        return len(rows)
 
     async def get_top_tokens(self, limit: int = 50) -> list[dict]:
         """Get the top-performing discovered tokens, sorted by price multiplier."""
@@ -149,15 +494,13 @@ class Database:
             ORDER BY price_multiplier DESC
             LIMIT ?
         """
-        cursor = await self.connection.execute(sql, (limit,))
-        rows = await cursor.fetchall()
+        rows = await self._fetchall(sql, (limit,))
         return [dict(row) for row in rows]
 
     async def get_token_by_mint(self, mint_address: str) -> dict | None:
         """Look up a specific token by its mint address."""
         sql = "SELECT * FROM tokens WHERE mint_address = ?"
-        cursor = await self.connection.execute(sql, (mint_address,))
-        row = await cursor.fetchone()
+        row = await self._fetchone(sql, (mint_address,))
         return dict(row) if row else None
 
     # =========================================================================
@@ -170,50 +513,27 @@ class Database:
         'Upsert' means: insert if new, update if it already exists.
         Stores both scoring data and GMGN enrichment data.
         """
-        import json
+        return await self._insert(_UPSERT_WALLET_SQL, self._wallet_params(wallet_data))
 
-        sql = """
-            INSERT INTO wallets (
-                address, total_score, pnl_score, win_rate_score, timing_score,
-                consistency_score, total_pnl_sol, total_trades, winning_trades,
-                win_rate, avg_entry_rank, unique_winners,
-                gmgn_realized_profit_usd, gmgn_profit_30d_usd, gmgn_sol_balance,
-                gmgn_winrate, gmgn_buy_30d, gmgn_sell_30d, gmgn_tags,
-                source, is_flagged, flag_reason, is_monitored, last_active, score_updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(address) DO UPDATE SET
-                total_score = excluded.total_score,
-                pnl_score = excluded.pnl_score,
-                win_rate_score = excluded.win_rate_score,
-                timing_score = excluded.timing_score,
-                consistency_score = excluded.consistency_score,
-                total_pnl_sol = excluded.total_pnl_sol,
-                total_trades = excluded.total_trades,
-                winning_trades = excluded.winning_trades,
-                win_rate = excluded.win_rate,
-                avg_entry_rank = excluded.avg_entry_rank,
-                unique_winners = excluded.unique_winners,
-                gmgn_realized_profit_usd = excluded.gmgn_realized_profit_usd,
-                gmgn_profit_30d_usd = excluded.gmgn_profit_30d_usd,
-                gmgn_sol_balance = excluded.gmgn_sol_balance,
-                gmgn_winrate = excluded.gmgn_winrate,
-                gmgn_buy_30d = excluded.gmgn_buy_30d,
-                gmgn_sell_30d = excluded.gmgn_sell_30d,
-                gmgn_tags = excluded.gmgn_tags,
-                source = excluded.source,
-                is_flagged = excluded.is_flagged,
-                flag_reason = excluded.flag_reason,
-                is_monitored = excluded.is_monitored,
-                last_active = excluded.last_active,
-                score_updated_at = excluded.score_updated_at
+    async def upsert_wallets_bulk(self, wallets: list[dict[str, Any]]) -> None:
+        """
+        Upsert many wallets in one transaction (one commit, one fsync).
+        Same semantics as calling upsert_wallet for each dict.
         """
+        if not wallets:
+            return
+        await self._run_many(_UPSERT_WALLET_SQL, [self._wallet_params(w) for w in wallets])
+
+    @staticmethod
+    def _wallet_params(wallet_data: dict[str, Any]) -> tuple:
+        """Build the wallets upsert parameter tuple from a wallet dict."""
         now = datetime.now(timezone.utc).isoformat()
 
-        # Serialize tags list to JSON string for storage
-        gmgn_tags = wallet_data.get("gmgn_tags") or []
-        tags_json = json.dumps(gmgn_tags) if isinstance(gmgn_tags, list) else "[]"
+        # Serialize tags list to JSON string for storage.
+        # Callers hand us a list (normalized where GMGN data enters the analyzer).
+        tags_json = orjson.dumps(wallet_data.get("gmgn_tags") or []).decode()
 
-        cursor = await self.connection.execute(sql, (
+        return (
             wallet_data["address"],
             wallet_data.get("total_score", 0),
             wallet_data.get("pnl_score", 0),
@@ -239,9 +559,7 @@ class Database:
             wallet_data.get("is_monitored", False),
             wallet_data.get("last_active", now),
             now,
-        ))
-        await self.connection.commit()
-        return cursor.lastrowid
+        )
 
     async def get_top_wallets(self, limit: int = 50, only_monitored: bool = False) -> list[dict]:
         """Get top-scored wallets. Optionally filter to only monitored ones."""
@@ -249,43 +567,52 @@ class Database:
             sql = "SELECT * FROM wallets WHERE is_monitored = TRUE ORDER BY total_score DESC LIMIT ?"
         else:
             sql = "SELECT * FROM wallets WHERE is_flagged = FALSE ORDER BY total_score DESC LIMIT ?"
-        cursor = await self.connection.execute(sql, (limit,))
-        rows = await cursor.fetchall()
+        rows = await self._fetchall(sql, (limit,))
         return [dict(row) for row in rows]
 
     async def get_monitored_wallets(self) -> list[dict]:
         """Get all wallets that are being actively monitored."""
         sql = "SELECT * FROM wallets WHERE is_monitored = TRUE ORDER BY total_score DESC"
-        cursor = await self.connection.execute(sql)
-        rows = await cursor.fetchall()
+        rows = await self._fetchall(sql)
         return [dict(row) for row in rows]
 
     async def set_wallet_monitored(self, address: str, monitored: bool) -> None:
         """Turn monitoring on or off for a specific wallet."""
         sql = "UPDATE wallets SET is_monitored = ? WHERE address = ?"
-        await self.connection.execute(sql, (monitored, address))
-        await self.connection.commit()
+        await self._run_write(sql, (monitored, address))
 
     async def update_wallet_score(self, address: str, score: float) -> None:
         """Update a wallet's composite score (0-100)."""
         sql = "UPDATE wallets SET total_score = ? WHERE address = ?"
-        await self.connection.execute(sql, (score, address))
-        await self.connection.commit()
+        await self._run_write(sql, (score, address))
 
     # =========================================================================
     # Wallet-Token Trade Links (Stage 2: Analyzer)
     # =========================================================================
 
-    async def insert_wallet_token_trade(self, trade_data: dict[str, Any]) -> int:
-        """Record that a wallet traded a specific token (used for scoring)."""
+    async def insert_wallet_token_trade(self, trade_data: dict[str, Any]) -> None:
+        """
+        Record that a wallet traded a specific token (used for scoring).
+        Re-running the finder on the same token refreshes the row instead of duplicating it.
+        """
         sql = """
             INSERT INTO wallet_token_trades (
                 wallet_address, token_mint, token_symbol, buy_amount_sol,
                 sell_amount_sol, pnl_sol, buy_price, sell_price, entry_rank,
                 first_buy_at, last_sell_at
             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(wallet_address, token_mint) DO UPDATE SET
+                token_symbol = excluded.token_symbol,
+                buy_amount_sol = excluded.buy_amount_sol,
+                sell_amount_sol = excluded.sell_amount_sol,
+                pnl_sol = excluded.pnl_sol,
+                buy_price = excluded.buy_price,
+                sell_price = excluded.sell_price,
+                entry_rank = excluded.entry_rank,
+                first_buy_at = excluded.first_buy_at,
+                last_sell_at = excluded.last_sell_at
         """
-        cursor = await self.connection.execute(sql, (
+        await self._run_write(sql, (
             trade_data["wallet_address"],
             trade_data["token_mint"],
             trade_data.get("token_symbol"),
@@ -298,8 +625,6 @@ class Database:
             trade_data.get("first_buy_at"),
             trade_data.get("last_sell_at"),
         ))
-        await self.connection.commit()
-        return cursor.lastrowid
 
     # =========================================================================
     # Signal Operations (Stage 3: Monitor)
@@ -313,7 +638,7 @@ class Database:
                 wallet_score, confidence
             ) VALUES (?, ?, ?, ?, ?, ?)
         """
-        cursor = await self.connection.execute(sql, (
+        return await self._insert(sql, (
             signal_data["wallet_address"],
             signal_data["token_mint"],
             signal_data.get("token_symbol"),
@@ -321,20 +646,16 @@ class Database:
             signal_data.get("wallet_score"),
             signal_data.get("confidence"),
         ))
-        await self.connection.commit()
-        return cursor.lastrowid
 
     async def mark_signal_executed(self, signal_id: int, trade_id: int) -> None:
         """Mark a signal as having been executed, linking it to the trade."""
         sql = "UPDATE signals SET executed = TRUE, trade_id = ? WHERE id = ?"
-        await self.connection.execute(sql, (trade_id, signal_id))
-        await self.connection.commit()
+        await self._run_write(sql, (trade_id, signal_id))
 
     async def mark_signal_skipped(self, signal_id: int, reason: str) -> None:
         """Mark a signal as skipped, recording why."""
         sql = "UPDATE signals SET skip_reason = ? WHERE id = ?"
-        await self.connection.execute(sql, (reason, signal_id))
-        await self.connection.commit()
+        await self._run_write(sql, (reason, signal_id))
 
     # =========================================================================
     # Trade Operations (Stage 4: Executor)
@@ -353,7 +674,7 @@ class Database:
                 priority_fee_lamports, error_message
             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """
-        cursor = await self.connection.execute(sql, (
+        return await self._insert(sql, (
             trade_data["token_mint"],
             trade_data.get("token_symbol"),
             trade_data["side"],
@@ -369,8 +690,6 @@ class Database:
             trade_data.get("priority_fee_lamports"),
             trade_data.get("error_message"),
         ))
-        await self.connection.commit()
-        return cursor.lastrowid
 
     async def update_trade_status(
         self, trade_id: int, status: str, tx_signature: str | None = None, error: str | None = None
@@ -379,17 +698,15 @@ class Database:
         now = datetime.now(timezone.utc).isoformat()
         if status == "confirmed":
             sql = "UPDATE trades SET status = ?, tx_signature = COALESCE(?, tx_signature), confirmed_at = ? WHERE id = ?"
-            await self.connection.execute(sql, (status, tx_signature, now, trade_id))
+            await self._run_write(sql, (status, tx_signature, now, trade_id))
         else:
             sql = "UPDATE trades SET status = ?, error_message = ? WHERE id = ?"
-            await self.connection.execute(sql, (status, error, trade_id))
-        await self.connection.commit()
+            await self._run_write(sql, (status, error, trade_id))
 
     async def get_todays_trades(self) -> list[dict]:
         """Get all trades executed today (for daily loss tracking)."""
         sql = "SELECT * FROM trades WHERE date(created_at) = date('now') ORDER BY created_at DESC"
-        cursor = await self.connection.execute(sql)
-        rows = await cursor.fetchall()
+        rows = await self._fetchall(sql)
         return [dict(row) for row in rows]
 
     async def get_todays_pnl(self) -> float:
@@ -403,8 +720,7 @@ class Database:
             FROM trades
             WHERE date(created_at) = date('now') AND status = 'confirmed'
         """
-        cursor = await self.connection.execute(sql)
-        row = await cursor.fetchone()
+        row = await self._fetchone(sql)
         return float(row["daily_pnl"]) if row else 0.0
 
     # =========================================================================
@@ -413,7 +729,7 @@ class Database:
 
     async def open_position(self, position_data: dict[str, Any]) -> int:
         """Open a new trading position."""
-        tp_levels_json = json.dumps(position_data.get("take_profit_levels", []))
+        tp_levels_json = orjson.dumps(position_data.get("take_profit_levels") or []).decode()
         sql = """
             INSERT INTO positions (
                 token_mint, token_symbol, entry_price_usd, amount_sol_invested,
@@ -421,7 +737,7 @@ class Database:
                 triggered_by_wallet, signal_source_type
             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
         """
-        cursor = await self.connection.execute(sql, (
+        return await self._insert(sql, (
             position_data["token_mint"],
             position_data.get("token_symbol"),
             position_data["entry_price_usd"],
@@ -432,28 +748,24 @@ class Database:
             position_data.get("triggered_by_wallet"),
             position_data.get("signal_source_type", "human"),
         ))
-        await self.connection.commit()
-        return cursor.lastrowid
 
     async def get_open_positions(self) -> list[dict]:
         """Get all currently open positions."""
         sql = "SELECT * FROM positions WHERE status = 'open'"
-        cursor = await self.connection.execute(sql)
-        rows = await cursor.fetchall()
+        rows = await self._fetchall(sql)
         return [dict(row) for row in rows]
 
     async def get_open_position_count(self) -> int:
         """Get the number of currently open positions (for limit checking)."""
-        sql = "SELECT COUNT(*) as count FROM positions WHERE status = 'open'"
-        cursor = await self.connection.execute(sql)
-        row = await cursor.fetchone()
-        return row["count"] if row else 0
+        # Answered from idx_positions_open alone; read the scalar positionally
+        sql = "SELECT COUNT(*) FROM positions WHERE status = 'open'"
+        row = await self._hot_fetchone(sql)
+        return row[0] if row else 0
 
     async def get_position_by_token(self, token_mint: str) -> dict | None:
         """Check if we already have an open position in a specific token."""
         sql = "SELECT * FROM positions WHERE token_mint = ? AND status = 'open'"
-        cursor = await self.connection.execute(sql, (token_mint,))
-        row = await cursor.fetchone()
+        row = await self._hot_fetchone(sql, (token_mint,))
         return dict(row) if row else None
 
     async def close_position(self, position_id: int, reason: str, realized_pnl: float) -> None:
@@ -465,8 +777,7 @@ class Database:
                 closed_at = ?
             WHERE id = ?
         """
-        await self.connection.execute(sql, (reason, realized_pnl, now, position_id))
-        await self.connection.commit()
+        await self._run_write(sql, (reason, realized_pnl, now, position_id))
 
     async def update_position_price(self, position_id: int, current_price: float, unrealized_pnl: float) -> None:
         """Update a position's current price and unrealized PnL."""
@@ -476,20 +787,17 @@ class Database:
                 current_price_usd = ?, unrealized_pnl_sol = ?, last_checked_at = ?
             WHERE id = ?
         """
-        await self.connection.execute(sql, (current_price, unrealized_pnl, now, position_id))
-        await self.connection.commit()
+        await self._run_write(sql, (current_price, unrealized_pnl, now, position_id))
 
     async def update_position_tp_levels(self, position_id: int, tp_levels_json: str) -> None:
         """Save updated take-profit levels (with hit flags) back to the position."""
         sql = "UPDATE positions SET take_profit_levels = ? WHERE id = ?"
-        await self.connection.execute(sql, (tp_levels_json, position_id))
-        await self.connection.commit()
+        await self._run_write(sql, (tp_levels_json, position_id))
 
     async def update_position_tokens(self, position_id: int, new_token_amount: float) -> None:
         """Update remaining tokens after a partial sell."""
         sql = "UPDATE positions SET amount_tokens_held = ? WHERE id = ?"
-        await self.connection.execute(sql, (new_token_amount, position_id))
-        await self.connection.commit()
+        await self._run_write(sql, (new_token_amount, position_id))
 
     # =========================================================================
     # Daily Stats (Stage 5: Telegram summaries)
@@ -500,7 +808,13 @@ class Database:
         today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
         trades = await self.get_todays_trades()
 
-        total_pnl = await self.get_todays_pnl()
+        # Same math as get_todays_pnl(), but over the rows we already fetched
+        # (saves a second scan of today's trades)
+        total_pnl = sum(
+            t["amount_sol"] if t["side"] == "sell" else -t["amount_sol"]
+            for t in trades
+            if t["status"] == "confirmed" and t["side"] in ("buy", "sell")
+        )
         buy_count = sum(1 for t in trades if t["side"] == "buy")
         sell_count = sum(1 for t in trades if t["side"] == "sell")
         wins = sum(1 for t in trades if t["side"] == "sell" and (t.get("amount_sol") or 0) > 0)
@@ -522,10 +836,9 @@ class Database:
                 positions_closed = excluded.positions_closed,
                 total_pnl_sol = excluded.total_pnl_sol
         """
-        await self.connection.execute(sql, (
+        await self._run_write(sql, (
             today, len(trades), buy_count, sell_count, total_pnl
         ))
-        await self.connection.commit()
 
         return stats
 
@@ -541,25 +854,29 @@ class Database:
                 best_side_wallet, avg_lead_time_seconds
             ) VALUES (?, ?, ?, ?, ?)
         """
-        cursor = await self.connection.execute(sql, (
+        return await self._insert(sql, (
             cluster_data["seed_wallet"],
             cluster_data.get("cluster_label"),
             cluster_data.get("total_members", 0),
             cluster_data.get("best_side_wallet"),
             cluster_data.get("avg_lead_time_seconds", 0),
         ))
-        await self.connection.commit()
-        return cursor.lastrowid
 
-    async def add_cluster_member(self, member_data: dict[str, Any]) -> int:
-        """Add a wallet to a cluster. Returns the member record ID."""
+    async def add_cluster_member(self, member_data: dict[str, Any]) -> None:
+        """Add a wallet to a cluster (or refresh its link if it's already a member)."""
         sql = """
             INSERT INTO wallet_cluster_members (
                 cluster_id, wallet_address, relationship_type,
                 is_side_wallet, confidence, avg_lead_time_seconds, evidence
             ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(cluster_id, wallet_address) DO UPDATE SET
+                relationship_type = excluded.relationship_type,
+                is_side_wallet = excluded.is_side_wallet,
+                confidence = excluded.confidence,
+                avg_lead_time_seconds = excluded.avg_lead_time_seconds,
+                evidence = excluded.evidence
         """
-        cursor = await self.connection.execute(sql, (
+        await self._run_write(sql, (
             member_data["cluster_id"],
             member_data["wallet_address"],
             member_data["relationship_type"],
@@ -568,35 +885,32 @@ class Database:
             member_data.get("avg_lead_time_seconds", 0),
             member_data.get("evidence"),
         ))
-        await self.connection.commit()
-        return cursor.lastrowid
 
     async def get_cluster_by_seed(self, seed_wallet: str) -> dict | None:
         """Look up if we've already analyzed this seed wallet."""
         sql = "SELECT * FROM wallet_clusters WHERE seed_wallet = ?"
-        cursor = await self.connection.execute(sql, (seed_wallet,))
-        row = await cursor.fetchone()
+        row = await self._fetchone(sql, (seed_wallet,))
         return dict(row) if row else None
 
     async def get_cluster_members(self, cluster_id: int) -> list[dict]:
         """Get all members of a specific cluster."""
         sql = "SELECT * FROM wallet_cluster_members WHERE cluster_id = ? ORDER BY confidence DESC"
-        cursor = await self.connection.execute(sql, (cluster_id,))
-        rows = await cursor.fetchall()
+        rows = await self._fetchall(sql, (cluster_id,))
         return [dict(row) for row in rows]
 
     async def get_side_wallets(self) -> list[dict]:
         """Get all identified side wallets across all clusters."""
         sql = """
-            SELECT wcm.*, wc.seed_wallet, w.total_score, w.is_monitored
+            SELECT wcm.cluster_id, wcm.wallet_address, wcm.relationship_type,
+                   wcm.confidence, wcm.avg_lead_time_seconds,
+                   wc.seed_wallet, w.total_score, w.is_monitored
             FROM wallet_cluster_members wcm
             JOIN wallet_clusters wc ON wcm.cluster_id = wc.id
             LEFT JOIN wallets w ON wcm.wallet_address = w.address
             WHERE wcm.is_side_wallet = TRUE
             ORDER BY wcm.confidence DESC
         """
-        cursor = await self.connection.execute(sql)
-        rows = await cursor.fetchall()
+        rows = await self._fetchall(sql)
         return [dict(row) for row in rows]
 
     async def get_all_clusters(self) -> list[dict]:
@@ -607,15 +921,13 @@ class Database:
             LEFT JOIN wallets w ON wc.seed_wallet = w.address
             ORDER BY wc.avg_lead_time_seconds DESC
         """
-        cursor = await self.connection.execute(sql)
-        rows = await cursor.fetchall()
+        rows = await self._fetchall(sql)
         return [dict(row) for row in rows]
 
     async def get_wallet_token_trades_for_wallet(self, wallet_address: str) -> list[dict]:
         """Get all token trades for a specific wallet."""
         sql = "SELECT * FROM wallet_token_trades WHERE wallet_address = ?"
-        cursor = await self.connection.execute(sql, (wallet_address,))
-        rows = await cursor.fetchall()
+        rows = await self._fetchall(sql, (wallet_address,))
         return [dict(row) for row in rows]
 
     # =========================================================================
@@ -624,25 +936,24 @@ class Database:
 
     async def upsert_fomo_trader(self, trader_data: dict[str, Any]) -> int:
         """Insert or update a FOMO trader record."""
+        row_id = await self._insert(_UPSERT_FOMO_TRADER_SQL, self._fomo_trader_params(trader_data))
+        if self._known_fomo is not None:
+            self._known_fomo.add(trader_data["wallet_address"])
+        return row_id
+
+    async def upsert_fomo_traders_bulk(self, traders: list[dict[str, Any]]) -> None:
+        """Upsert many FOMO traders in one transaction (one commit, one fsync)."""
+        if not traders:
+            return
+        await self._run_many(_UPSERT_FOMO_TRADER_SQL, [self._fomo_trader_params(t) for t in traders])
+        if self._known_fomo is not None:
+            self._known_fomo.update(t["wallet_address"] for t in traders)
+
+    @staticmethod
+    def _fomo_trader_params(trader_data: dict[str, Any]) -> tuple:
+        """Build the fomo_traders upsert parameter tuple from a trader dict."""
         now = datetime.now(timezone.utc).isoformat()
-        sql = """
-            INSERT INTO fomo_traders (
-                wallet_address, username, twitter_handle, platform,
-                ranking, pnl_24h_usd, pnl_7d_usd, pnl_30d_usd,
-                pnl_all_time_usd, is_tracked, notes, last_updated
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(wallet_address) DO UPDATE SET
-                username = excluded.username,
-                twitter_handle = excluded.twitter_handle,
-                ranking = excluded.ranking,
-                pnl_24h_usd = excluded.pnl_24h_usd,
-                pnl_7d_usd = excluded.pnl_7d_usd,
-                pnl_30d_usd = excluded.pnl_30d_usd,
-                pnl_all_time_usd = excluded.pnl_all_time_usd,
-                notes = COALESCE(excluded.notes, fomo_traders.notes),
-                last_updated = excluded.last_updated
-        """
-        cursor = await self.connection.execute(sql, (
+        return (
             trader_data["wallet_address"],
             trader_data.get("username"),
             trader_data.get("twitter_handle"),
@@ -655,9 +966,7 @@ class Database:
             trader_data.get("is_tracked", True),
             trader_data.get("notes"),
             now,
-        ))
-        await self.connection.commit()
-        return cursor.lastrowid
+        )
 
     async def get_fomo_traders(self, tracked_only: bool = True) -> list[dict]:
         """Get FOMO traders, optionally filtered to tracked ones only."""
@@ -665,17 +974,54 @@ class Database:
             sql = "SELECT * FROM fomo_traders WHERE is_tracked = TRUE ORDER BY ranking ASC"
         else:
             sql = "SELECT * FROM fomo_traders ORDER BY ranking ASC"
-        cursor = await self.connection.execute(sql)
-        rows = await cursor.fetchall()
+        rows = await self._fetchall(sql)
         return [dict(row) for row in rows]
 
     async def get_fomo_trader(self, wallet_address: str) -> dict | None:
         """Look up a specific FOMO trader by wallet address."""
+        if self._known_fomo is not None and wallet_address not in self._known_fomo:
+            return None
         sql = "SELECT * FROM fomo_traders WHERE wallet_address = ?"
-        cursor = await self.connection.execute(sql, (wallet_address,))
-        row = await cursor.fetchone()
+        row = await self._fetchone(sql, (wallet_address,))
         return dict(row) if row else None
 
+    async def get_existing_fomo_traders(self, wallet_addresses: list[str]) -> set[str]:
+        """
+        Return which of the given addresses are already in fomo_traders.
+        Answered from the in-memory address set once initialize() has run.
+        Before that it runs one IN (...) query per 900 addresses, because
+        SQLite caps bound parameters at 999 on older builds.
+        """
+        if self._known_fomo is not None:
+            return self._known_fomo.intersection(wallet_addresses)
+        existing: set[str] = set()
+        async with self._reader() as reader:
+            for i in range(0, len(wallet_addresses), self.SQL_PARAM_CHUNK):
+                chunk = wallet_addresses[i:i + self.SQL_PARAM_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                sql = f"SELECT wallet_address FROM fomo_traders WHERE wallet_address IN ({placeholders})"
+                cursor = await reader.execute(sql, chunk)
+                existing.update(row[0] for row in await cursor.fetchall())
+        return existing
+
+    async def get_fomo_scan_signature(self) -> str | None:
+        """Newest relayer signature seen by the last FOMO scan (None before the first run)."""
+        sql = "SELECT last_signature FROM fomo_scan_state WHERE id = 1"
+        row = await self._fetchone(sql)
+        return row[0] if row else None
+
+    async def set_fomo_scan_signature(self, signature: str) -> None:
+        """Record the newest relayer signature a FOMO scan reached."""
+        now = datetime.now(timezone.utc).isoformat()
+        sql = """
+            INSERT INTO fomo_scan_state (id, last_signature, last_scanned_at)
+            VALUES (1, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                last_signature = excluded.last_signature,
+                last_scanned_at = excluded.last_scanned_at
+        """
+        await self._run_write(sql, (signature, now))
+
     # =========================================================================
     # Agent Decision Operations (Session 8: Agent Brain)
     # =========================================================================
@@ -693,7 +1039,7 @@ class Database:
                 executed, trade_id, amount_sol
             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """
-        cursor = await self.connection.execute(sql, (
+        return await self._insert(sql, (
             decision_data["token_mint"],
             decision_data.get("token_symbol"),
             decision_data["decision"],
@@ -708,8 +1054,6 @@ class Database:
             decision_data.get("trade_id"),
             decision_data.get("amount_sol", 0),
         ))
-        await self.connection.commit()
-        return cursor.lastrowid
 
     async def update_agent_decision_outcome(
         self, decision_id: int, pnl_sol: float, multiplier: float | None = None
@@ -720,14 +1064,12 @@ class Database:
                 outcome_pnl_sol = ?, outcome_multiplier = ?
             WHERE id = ?
         """
-        await self.connection.execute(sql, (pnl_sol, multiplier, decision_id))
-        await self.connection.commit()
+        await self._run_write(sql, (pnl_sol, multiplier, decision_id))
 
     async def mark_agent_decision_executed(self, decision_id: int, trade_id: int) -> None:
         """Mark a decision as executed, linking it to the trade."""
         sql = "UPDATE agent_decisions SET executed = TRUE, trade_id = ? WHERE id = ?"
-        await self.connection.execute(sql, (trade_id, decision_id))
-        await self.connection.commit()
+        await self._run_write(sql, (trade_id, decision_id))
 
     async def get_agent_decisions(self, limit: int = 100) -> list[dict]:
         """Get recent agent decisions for the journal view."""
@@ -735,8 +1077,7 @@ class Database:
             SELECT * FROM agent_decisions
             ORDER BY created_at DESC LIMIT ?
         """
-        cursor = await self.connection.execute(sql, (limit,))
-        rows = await cursor.fetchall()
+        rows = await self._fetchall(sql, (limit,))
         results = []
         for r in rows:
             d = dict(r)
@@ -763,8 +1104,7 @@ class Database:
                 AVG(CASE WHEN executed = TRUE THEN confidence END) as avg_buy_confidence
             FROM agent_decisions
         """
-        cursor = await self.connection.execute(sql)
-        row = await cursor.fetchone()
+        row = await self._fetchone(sql)
         if not row:
             return {}
         return dict(row)
@@ -785,15 +1125,13 @@ class Database:
             WHERE status = 'closed' AND triggered_by_wallet IS NOT NULL
             GROUP BY triggered_by_wallet
         """
-        cursor = await self.connection.execute(sql)
-        rows = await cursor.fetchall()
+        rows = await self._fetchall(sql)
         return {row["triggered_by_wallet"]: float(row["net_pnl"]) for row in rows}
 
     async def get_all_wallets(self) -> list[dict]:
         """Get all wallets (not just monitored) — used by the refresher for ranking."""
         sql = "SELECT * FROM wallets ORDER BY total_score DESC"
-        cursor = await self.connection.execute(sql)
-        rows = await cursor.fetchall()
+        rows = await self._fetchall(sql)
         return [dict(row) for row in rows]
 
     # =========================================================================
@@ -813,4 +1151,6 @@ class Database:
             counts[table] = row["c"] if row else 0
             await self.connection.execute(f"DELETE FROM {table}")
         await self.connection.commit()
+        # A full wipe leaves a large WAL behind — fold it back in now
+        await self.checkpoint()
         return counts
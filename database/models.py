@@ -11,11 +11,20 @@ Think of this as the bot's filing system:
 - trades: Every trade the bot executes (our audit trail)
 - positions: Currently open positions with TP/SL tracking
 - daily_stats: End-of-day summaries
+- fomo_scan_state: Where the last FOMO relayer scan stopped
 
 We use raw SQL (not an ORM) to keep things simple and fast.
 Each table has clear columns with comments explaining what they store.
 """
 
+from dataclasses import dataclass, fields
+from typing import Any
+
+# Bump whenever CREATE_TABLES_SQL or Database._run_migrations changes.
+# Stored in PRAGMA user_version; a database already at this version skips
+# the schema script on startup.
+SCHEMA_VERSION = 4
+
 # SQL statements to create all tables
 # These run once when the bot first starts up
 
@@ -85,10 +94,10 @@ CREATE TABLE IF NOT EXISTS wallets (
     source TEXT DEFAULT 'manual',          -- Where we found this wallet: fomo, gmgn, manual, cluster
 
     -- Flags
-    is_flagged BOOLEAN DEFAULT FALSE,      -- True if this wallet looks suspicious
+    is_flagged INTEGER DEFAULT 0 CHECK (is_flagged IN (0, 1)),      -- True if this wallet looks suspicious
     flag_reason TEXT,                       -- Why it was flagged (bot, insider, dev, etc.)
-    is_monitored BOOLEAN DEFAULT FALSE,    -- True if we're actively watching this wallet
-    is_bot_speed BOOLEAN DEFAULT FALSE,    -- True if wallet trades 50+/day (bot-like speed)
+    is_monitored INTEGER DEFAULT 0 CHECK (is_monitored IN (0, 1)),    -- True if we're actively watching this wallet
+    is_bot_speed INTEGER DEFAULT 0 CHECK (is_bot_speed IN (0, 1)),    -- True if wallet trades 50+/day (bot-like speed)
 
     -- Timestamps
     first_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -100,9 +109,9 @@ CREATE TABLE IF NOT EXISTS wallets (
 -- Links wallets to their trades on winning tokens
 -- Used to calculate wallet scores
 -- =============================================
+-- Keyed by (wallet, token) and stored WITHOUT ROWID: one clustered B-tree
+-- instead of a rowid table plus a lookup index
 CREATE TABLE IF NOT EXISTS wallet_token_trades (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-
     wallet_address TEXT NOT NULL,
     token_mint TEXT NOT NULL,
     token_symbol TEXT,
@@ -119,9 +128,10 @@ CREATE TABLE IF NOT EXISTS wallet_token_trades (
     first_buy_at TIMESTAMP,
     last_sell_at TIMESTAMP,
 
+    PRIMARY KEY (wallet_address, token_mint),
     FOREIGN KEY (wallet_address) REFERENCES wallets(address),
     FOREIGN KEY (token_mint) REFERENCES tokens(mint_address)
-);
+) WITHOUT ROWID;
 
 -- =============================================
 -- Signals: when a monitored wallet does something interesting
@@ -138,7 +148,7 @@ CREATE TABLE IF NOT EXISTS signals (
     confidence REAL,                       -- How confident we are (0-1)
 
     -- Was this signal acted on?
-    executed BOOLEAN DEFAULT FALSE,        -- Did we copy this trade?
+    executed INTEGER DEFAULT 0 CHECK (executed IN (0, 1)),        -- Did we copy this trade?
     trade_id INTEGER,                      -- Link to our trade if we did copy it
     skip_reason TEXT,                      -- Why we skipped it (if we did)
 
@@ -222,9 +232,10 @@ CREATE TABLE IF NOT EXISTS positions (
 -- =============================================
 -- Daily summary stats
 -- =============================================
+-- One row per day, keyed by the date itself (WITHOUT ROWID: no separate
+-- UNIQUE index to probe on the daily upsert)
 CREATE TABLE IF NOT EXISTS daily_stats (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    date TEXT UNIQUE NOT NULL,             -- YYYY-MM-DD
+    date TEXT PRIMARY KEY NOT NULL,        -- YYYY-MM-DD
 
     -- Trading activity
     trades_executed INTEGER DEFAULT 0,
@@ -239,10 +250,10 @@ CREATE TABLE IF NOT EXISTS daily_stats (
 
     -- Risk
     max_drawdown_sol REAL DEFAULT 0,
-    hit_daily_loss_limit BOOLEAN DEFAULT FALSE,
+    hit_daily_loss_limit INTEGER DEFAULT 0 CHECK (hit_daily_loss_limit IN (0, 1)),
 
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-);
+) WITHOUT ROWID;
 
 -- =============================================
 -- Wallet clusters: groups of linked wallets
@@ -266,39 +277,56 @@ CREATE TABLE IF NOT EXISTS wallet_clusters (
 -- =============================================
 -- Members within each wallet cluster
 -- =============================================
+-- Keyed by (cluster, wallet), WITHOUT ROWID like wallet_token_trades
 CREATE TABLE IF NOT EXISTS wallet_cluster_members (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-
     cluster_id INTEGER NOT NULL,
     wallet_address TEXT NOT NULL,
 
     relationship_type TEXT NOT NULL,       -- "funding_source", "funding_dest",
                                           -- "transfer_partner", "timing_correlated", "token_overlap"
-    is_side_wallet BOOLEAN DEFAULT FALSE,  -- True if this is the early accumulator
+    is_side_wallet INTEGER DEFAULT 0 CHECK (is_side_wallet IN (0, 1)),  -- True if this is the early accumulator
     confidence REAL DEFAULT 0,            -- 0.0-1.0 confidence in this link
     avg_lead_time_seconds REAL DEFAULT 0, -- How far ahead this wallet buys (seconds)
     evidence TEXT,                        -- JSON with relationship details
 
     discovered_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
 
+    PRIMARY KEY (cluster_id, wallet_address),
     FOREIGN KEY (cluster_id) REFERENCES wallet_clusters(id)
-);
+) WITHOUT ROWID;
 
 -- =============================================
 -- Indexes for fast lookups
 -- =============================================
 CREATE INDEX IF NOT EXISTS idx_wallets_score ON wallets(total_score DESC);
 CREATE INDEX IF NOT EXISTS idx_wallets_monitored ON wallets(is_monitored);
-CREATE INDEX IF NOT EXISTS idx_trades_token ON trades(token_mint);
+-- Per-token trade history, newest first (supersedes idx_trades_token)
+DROP INDEX IF EXISTS idx_trades_token;
+CREATE INDEX IF NOT EXISTS idx_trades_token_created ON trades(token_mint, created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_trades_created ON trades(created_at);
 CREATE INDEX IF NOT EXISTS idx_signals_created ON signals(created_at);
+-- Foreign-key side of signals <-> trades. Partial: most signals are never
+-- executed and manual trades have no signal, so both stay tiny
+CREATE INDEX IF NOT EXISTS idx_signals_trade_id ON signals(trade_id) WHERE trade_id IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_trades_signal_id ON trades(signal_id) WHERE signal_id IS NOT NULL;
 CREATE INDEX IF NOT EXISTS idx_positions_status ON positions(status);
-CREATE INDEX IF NOT EXISTS idx_wallet_token_trades_wallet ON wallet_token_trades(wallet_address);
-CREATE INDEX IF NOT EXISTS idx_wallet_token_trades_token ON wallet_token_trades(token_mint);
+-- Open positions only: the pre-trade count and per-token lookup never touch the table
+CREATE INDEX IF NOT EXISTS idx_positions_open ON positions(token_mint) WHERE status = 'open';
+-- wallet_token_trades: lookups by wallet use the primary key;
+-- by token in entry order (dashboard) uses this index
+DROP INDEX IF EXISTS idx_wallet_token_trades_wallet;
+DROP INDEX IF EXISTS idx_wallet_token_trades_token;
+DROP INDEX IF EXISTS idx_wallet_token_trades_wt;
+CREATE INDEX IF NOT EXISTS idx_wallet_token_trades_token_rank ON wallet_token_trades(token_mint, entry_rank);
 CREATE INDEX IF NOT EXISTS idx_clusters_seed ON wallet_clusters(seed_wallet);
-CREATE INDEX IF NOT EXISTS idx_cluster_members_cluster ON wallet_cluster_members(cluster_id);
+-- Members by cluster use the primary key
+DROP INDEX IF EXISTS idx_cluster_members_cluster;
 CREATE INDEX IF NOT EXISTS idx_cluster_members_wallet ON wallet_cluster_members(wallet_address);
-CREATE INDEX IF NOT EXISTS idx_cluster_members_side ON wallet_cluster_members(is_side_wallet);
+-- Partial index for get_side_wallets(): only side wallets, already in confidence order.
+-- Replaces the old low-selectivity boolean index on is_side_wallet.
+DROP INDEX IF EXISTS idx_cluster_members_side;
+CREATE INDEX IF NOT EXISTS idx_side_members ON wallet_cluster_members(confidence DESC, cluster_id, wallet_address)
+    WHERE is_side_wallet = TRUE;
 
 -- =============================================
 -- FOMO Traders: top traders from the FOMO leaderboard
@@ -321,7 +349,7 @@ CREATE TABLE IF NOT EXISTS fomo_traders (
     pnl_all_time_usd REAL DEFAULT 0,      -- All-time PnL in USD
 
     -- Tracking
-    is_tracked BOOLEAN DEFAULT TRUE,       -- Are we actively following this trader?
+    is_tracked INTEGER DEFAULT 1 CHECK (is_tracked IN (0, 1)),       -- Are we actively following this trader?
     notes TEXT,                            -- Manual notes about this trader
 
     -- Timestamps
@@ -329,6 +357,16 @@ CREATE TABLE IF NOT EXISTS fomo_traders (
     last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- =============================================
+-- FOMO relayer scan checkpoint (single row)
+-- =============================================
+-- Lets the discoverer stop paging once it reaches transactions it already saw
+CREATE TABLE IF NOT EXISTS fomo_scan_state (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    last_signature TEXT,                   -- Newest relayer tx signature scanned
+    last_scanned_at TIMESTAMP
+);
+
 -- =============================================
 -- Agent Decisions: the AI agent's decision journal
 -- Every decision the agent makes is logged here —
@@ -356,7 +394,7 @@ CREATE TABLE IF NOT EXISTS agent_decisions (
     liquidity_usd REAL,
 
     -- Execution
-    executed BOOLEAN DEFAULT FALSE,       -- Was this decision acted on?
+    executed INTEGER DEFAULT 0 CHECK (executed IN (0, 1)),       -- Was this decision acted on?
     trade_id INTEGER,                     -- Link to the trade if executed
     amount_sol REAL DEFAULT 0,            -- How much SOL was allocated
 
@@ -378,3 +416,42 @@ CREATE INDEX IF NOT EXISTS idx_agent_decisions_decision ON agent_decisions(decis
 CREATE INDEX IF NOT EXISTS idx_agent_decisions_created ON agent_decisions(created_at);
 
 """
+
+
+@dataclass(slots=True)
+class TokenRow:
+    """
+    One row for the tokens table, fields in INSERT column order.
+    Built once from a scanner dict so insert_token binds a plain tuple
+    instead of doing a dict lookup per column.
+    """
+    mint_address: str
+    symbol: str | None = None
+    name: str | None = None
+    market_cap_usd: float | None = None
+    price_usd: float | None = None
+    price_change_pct: float | None = None
+    price_multiplier: float | None = None
+    volume_24h_usd: float | None = None
+    liquidity_usd: float | None = None
+    holder_count: int | None = None
+    pair_address: str | None = None
+    dex_name: str | None = None
+    data_source: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "TokenRow":
+        """Pick the tokens-table columns out of a scanner dict (extra keys are ignored)."""
+        return cls(*(data.get(name) for name in _TOKEN_ROW_FIELDS))
+
+    def as_params(self) -> tuple:
+        """Column values in INSERT order (cheaper than dataclasses.astuple, which deep-copies)."""
+        return (
+            self.mint_address, self.symbol, self.name, self.market_cap_usd,
+            self.price_usd, self.price_change_pct, self.price_multiplier,
+            self.volume_24h_usd, self.liquidity_usd, self.holder_count,
+            self.pair_address, self.dex_name, self.data_source,
+        )
+
+
+_TOKEN_ROW_FIELDS = tuple(f.name for f in fields(TokenRow))
@@ -20,6 +20,8 @@ Usage:
 import asyncio
 from typing import Any
 
+import orjson
+
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -29,7 +31,7 @@ FOMO_FEE_WALLET = "R4rNJHaffSUotNmqSKNEfDcJE8A7zJUkaoM5Jkd7cYX"
 FOMO_RELAYER = "AgmLJBMDCqWynYnQiPCuj9ewsNNsBJXyzoUhD9LJzN51"
 
 # Known infrastructure wallets to exclude (routers, programs, etc.)
-INFRA_WALLETS = {
+INFRA_WALLETS = frozenset({
     FOMO_FEE_WALLET,
     FOMO_RELAYER,
     "11111111111111111111111111111111",                     # System Program
@@ -37,7 +39,13 @@ INFRA_WALLETS = {
     "JUP6LkbZbjS1jKKwapdHNy74zcZ3tLUZoi5QNyVTaV4",       # Jupiter v6
     "ATokenGPvbdGVxr1b2hvZbsiqW5xWH25efTNsLJA8knL",      # ATA Program
     "ComputeBudget111111111111111111111111111111",          # Compute Budget
-}
+})
+
+# Enriched wallets are written to the DB in batches of this many
+SAVE_BATCH_SIZE = 200
+
+# getSignaturesForAddress returns at most 1000 signatures per page
+SIGNATURE_PAGE_SIZE = 1000
 
 
 def _float(val, default=0.0):
@@ -50,6 +58,19 @@ def _float(val, default=0.0):
         return default
 
 
+def _parse_tags(raw) -> list:
+    """GMGN sends tags as a list, a JSON string, or nothing — always return a list."""
+    if raw is None:
+        return []
+    if isinstance(raw, (list, tuple)):
+        return list(raw)
+    try:
+        tags = orjson.loads(raw)
+    except (orjson.JSONDecodeError, TypeError):
+        return []
+    return tags if isinstance(tags, list) else []
+
+
 class FomoDiscoverer:
     """
     Discovers FOMO platform traders by scanning the Privy relayer's on-chain
@@ -83,33 +104,40 @@ class FomoDiscoverer:
         Returns:
             List of discovered wallet dicts
         """
-        print(f"\n  Scanning FOMO relayer transactions...")
-        print(f"  Relayer: {FOMO_RELAYER[:8]}...{FOMO_RELAYER[-4:]}")
-        print(f"  Fee Wallet: {FOMO_FEE_WALLET[:8]}...{FOMO_FEE_WALLET[-4:]}")
+        logger.info(
+            "fomo_scan_starting",
+            relayer=f"{FOMO_RELAYER[:8]}...{FOMO_RELAYER[-4:]}",
+            fee_wallet=f"{FOMO_FEE_WALLET[:8]}...{FOMO_FEE_WALLET[-4:]}",
+        )
 
         # Step 1: Fetch relayer transaction history from Helius
-        raw_wallets = await self._scan_relayer_transactions(max_transactions)
+        raw_wallets, newest_sig = await self._scan_relayer_transactions(max_transactions)
+
+        # The scan checkpoint is only moved once everything found up to it is
+        # saved — if a run dies mid-enrichment, the next one rescans those
+        # transactions instead of skipping past the unsaved wallets
+        saved = await self._filter_and_save(raw_wallets, enrich)
+        if newest_sig:
+            await self.db.set_fomo_scan_signature(newest_sig)
+        return saved
 
+    async def _filter_and_save(self, raw_wallets: list[str], enrich: bool) -> list[dict]:
+        """Drop wallets already in the DB, then enrich/save the new ones."""
         if not raw_wallets:
-            print("  No FOMO wallets found. The relayer may have changed.")
+            logger.warning("fomo_no_wallets_found", note="the relayer may have changed")
             return []
 
-        print(f"  Found {len(raw_wallets)} unique FOMO wallets on-chain")
+        logger.info("fomo_wallets_found", count=len(raw_wallets))
 
-        # Step 2: Filter out wallets we already have in DB
-        new_wallets = []
-        existing_count = 0
-        for addr in raw_wallets:
-            existing = await self.db.get_fomo_trader(addr)
-            if existing:
-                existing_count += 1
-            else:
-                new_wallets.append(addr)
+        # Step 2: Filter out wallets we already have in DB (one batched lookup)
+        existing = await self.db.get_existing_fomo_traders(list(raw_wallets))
+        new_wallets = [addr for addr in raw_wallets if addr not in existing]
+        existing_count = len(raw_wallets) - len(new_wallets)
 
-        print(f"  Already tracked: {existing_count} | New: {len(new_wallets)}")
+        logger.info("fomo_wallets_filtered", already_tracked=existing_count, new=len(new_wallets))
 
         if not new_wallets:
-            print("  No new wallets to import.")
+            logger.info("fomo_no_new_wallets")
             return []
 
         # Step 3: Enrich via GMGN and save
@@ -118,156 +146,176 @@ class FomoDiscoverer:
         else:
             return await self._save_without_enrichment(new_wallets)
 
-    async def _scan_relayer_transactions(self, max_transactions: int) -> list[str]:
+    async def _scan_relayer_transactions(self, max_transactions: int) -> tuple[list[str], str | None]:
         """
         Scan the FOMO relayer's transaction history and extract user wallet
         addresses from the account keys of each transaction.
+        Returns the wallets and the newest signature seen; the caller stores
+        that as the next run's checkpoint once the wallets are saved.
 
         The relayer (Privy wallet) pays gas for every FOMO user trade.
         Each transaction's account list includes the user's wallet address.
         We identify user wallets by filtering out known infrastructure addresses.
         """
         all_user_wallets = set()
-        last_sig = None
-        scanned = 0
-        batch_num = 0
-
-        while scanned < max_transactions:
-            batch_num += 1
-            batch_size = min(100, max_transactions - scanned)
 
-            # Get transaction signatures for the relayer
-            sigs = await self.solana.get_signatures_for_address(
-                FOMO_RELAYER, limit=batch_size, before=last_sig
-            )
-
-            if not sigs:
-                break
-
-            # Parse transactions through Helius for enriched data
-            sig_list = [s["signature"] for s in sigs]
-            parsed_txs = await self.solana.get_parsed_transactions(sig_list)
-
-            for tx in parsed_txs:
-                wallets = self._extract_user_wallets(tx)
-                all_user_wallets.update(wallets)
-
-            scanned += len(sigs)
-            last_sig = sigs[-1]["signature"]
-
-            print(f"  Batch {batch_num}: scanned {scanned} txs, "
-                  f"found {len(all_user_wallets)} unique wallets so far")
-
-            # Rate limiting — Helius has generous limits but let's be polite
-            await asyncio.sleep(0.3)
-
-        return list(all_user_wallets)
+        # Signatures come newest-first. Stop once we reach where the previous
+        # run started, so repeat runs only parse new relayer activity.
+        # (If a run hits max_transactions first, the gap before that point is
+        # not revisited — the cap bounds the work either way.)
+        stop_sig = await self.db.get_fomo_scan_signature()
+        newest_sig = None
+
+        # Signature paging and Helius parsing are independent calls, so run
+        # them as a two-stage pipeline: the next page of signatures is fetched
+        # while the previous page is being parsed. maxsize=2 keeps the
+        # producer at most two pages ahead (same peak request rate).
+        sig_queue: asyncio.Queue[list[str] | None] = asyncio.Queue(maxsize=2)
+
+        async def produce_signatures() -> None:
+            nonlocal newest_sig
+            last_sig = None
+            scanned = 0
+            try:
+                while scanned < max_transactions:
+                    # Full 1000-signature pages; the Solana client splits the
+                    # parse step into parallel Helius-sized batches
+                    batch_size = min(SIGNATURE_PAGE_SIZE, max_transactions - scanned)
+
+                    # Get transaction signatures for the relayer
+                    sigs = await self.solana.get_signatures_for_address(
+                        FOMO_RELAYER, limit=batch_size, before=last_sig
+                    )
+                    if not sigs:
+                        break
+
+                    if newest_sig is None:
+                        newest_sig = sigs[0]["signature"]
+
+                    sig_list = [s["signature"] for s in sigs]
+                    reached_checkpoint = bool(stop_sig) and stop_sig in sig_list
+                    if reached_checkpoint:
+                        sig_list = sig_list[:sig_list.index(stop_sig)]
+
+                    if sig_list:
+                        await sig_queue.put(sig_list)
+
+                    scanned += len(sigs)
+                    last_sig = sigs[-1]["signature"]
+
+                    if reached_checkpoint:
+                        break
+
+                    # Rate limiting — Helius has generous limits but let's be polite
+                    await asyncio.sleep(0.3)
+            except Exception:
+                # Unblock the consumer before surfacing the error
+                await sig_queue.put(None)
+                raise
+            await sig_queue.put(None)  # Tell the consumer we're done
+
+        async def parse_transactions() -> None:
+            batch_num = 0
+            scanned = 0
+            while (sig_list := await sig_queue.get()) is not None:
+                batch_num += 1
+                # Parse transactions through Helius for enriched data
+                parsed_txs = await self.solana.get_parsed_transactions(sig_list)
+
+                for tx in parsed_txs:
+                    all_user_wallets.update(self._extract_user_wallets(tx))
+
+                scanned += len(sig_list)
+                logger.info(
+                    "fomo_scan_batch",
+                    batch=batch_num,
+                    scanned=scanned,
+                    unique_wallets=len(all_user_wallets),
+                )
+
+        producer = asyncio.create_task(produce_signatures())
+        try:
+            await parse_transactions()
+        except BaseException:
+            # Parsing failed: stop paging, and wait for the producer to wind
+            # down so it isn't left pending (or its own error unretrieved)
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+            raise
+        # Parsing drained the queue, so the producer is done — surface its errors
+        await producer
+
+        return list(all_user_wallets), newest_sig
 
     def _extract_user_wallets(self, parsed_tx: dict) -> set[str]:
         """
         Extract user wallet addresses from a parsed Helius transaction.
 
-        Strategy: Look at all accounts involved in the transaction.
-        Filter out known infrastructure (programs, relayer, fee wallet, etc.).
-        The remaining accounts that look like regular wallets are FOMO users.
+        Two signals, checked in a single pass each:
+        - Token transfers: whoever receives tokens (other than the fee wallet
+          and known infrastructure) is a user.
+        - Native SOL transfers: the relayer sends SOL (wrapped for trades)
+          straight to user wallets.
 
-        We also check token transfers — if a wallet receives swapped tokens,
-        it's definitely a user wallet.
+        Addresses shorter than 32 chars are parsing artifacts and are skipped.
         """
         user_wallets = set()
 
-        # Method 1: Check token transfers for the fee wallet pattern
-        # Every FOMO trade sends USDC to the fee wallet — the source is the user
-        token_transfers = parsed_tx.get("tokenTransfers", [])
-        for transfer in token_transfers:
-            to_addr = transfer.get("toUserAccount", "")
-            from_addr = transfer.get("fromUserAccount", "")
-
-            # If sending to fee wallet, the 'from' is likely a router/intermediate
-            # But the fee payer or other accounts will be the user
-            if to_addr == FOMO_FEE_WALLET:
-                # The fromUserAccount for fee transfers is usually a router
-                # The actual user is in the account list — we'll pick them up below
-                pass
-
-            # If receiving swapped tokens and not infrastructure, it's a user
-            if from_addr and from_addr not in INFRA_WALLETS:
-                # Could be user or router — we'll validate below
-                pass
-            if to_addr and to_addr not in INFRA_WALLETS and to_addr != FOMO_FEE_WALLET:
+        for transfer in parsed_tx.get("tokenTransfers") or ():
+            to_addr = transfer.get("toUserAccount")
+            if to_addr and len(to_addr) >= 32 and to_addr not in INFRA_WALLETS:
                 user_wallets.add(to_addr)
 
-        # Method 2: Check native SOL transfers
-        native_transfers = parsed_tx.get("nativeTransfers", [])
-        for transfer in native_transfers:
-            from_addr = transfer.get("fromUserAccount", "")
-            to_addr = transfer.get("toUserAccount", "")
-
-            # Relayer sends SOL to user wallets (wrapped SOL for trades)
-            if from_addr == FOMO_RELAYER and to_addr not in INFRA_WALLETS:
-                user_wallets.add(to_addr)
-
-        # Method 3: Check accountData for signers that aren't infrastructure
-        account_data = parsed_tx.get("accountData", [])
-        for acc in account_data:
-            addr = acc.get("account", "")
-            # Fee payers and signers who aren't the relayer are users
-            if addr and addr not in INFRA_WALLETS and len(addr) >= 32:
-                # Additional check: must be in the native/token transfer flow
-                # to avoid picking up random program accounts
-                pass
-
-        # Method 4: The fee payer — if it's the relayer, look at other signers
-        fee_payer = parsed_tx.get("feePayer", "")
-        if fee_payer == FOMO_RELAYER:
-            # Transaction description often contains the user wallet
-            desc = parsed_tx.get("description", "")
-            # The description format is usually like:
-            # "AgmL... swapped X SOL for Y TOKEN"
-            # But the actual user is in the instructions
-            pass
-
-        # Clean up: remove any remaining infrastructure
-        user_wallets -= INFRA_WALLETS
-        # Remove very short addresses (likely parsing artifacts)
-        user_wallets = {w for w in user_wallets if len(w) >= 32}
+        for transfer in parsed_tx.get("nativeTransfers") or ():
+            if transfer.get("fromUserAccount") == FOMO_RELAYER:
+                to_addr = transfer.get("toUserAccount")
+                if to_addr and len(to_addr) >= 32 and to_addr not in INFRA_WALLETS:
+                    user_wallets.add(to_addr)
 
         return user_wallets
 
     async def _enrich_and_save(self, addresses: list[str]) -> list[dict]:
         """Enrich wallet addresses via GMGN and save to database."""
-        from discovery.gmgn_client import GMGNClient
+        from discovery.gmgn_client import get_shared_client
 
-        gmgn = GMGNClient(
+        # Shared client: wallets already looked up this session come from its
+        # cache. It stays open — close_shared_clients() closes it at shutdown
+        gmgn = get_shared_client(
             cf_clearance=self.settings.gmgn_cf_clearance,
             cf_bm=self.settings.gmgn_cf_bm,
         )
 
         saved = []
+        trader_rows: list[dict] = []
+        wallet_rows: list[dict] = []
         total = len(addresses)
 
-        print(f"\n  Enriching {total} wallets via GMGN...")
+        logger.info("fomo_enrich_starting", wallets=total)
+
+        # GMGN calls are pure network waits — keep several in flight, each
+        # slot pausing after its request so the overall rate stays polite
+        sem = asyncio.Semaphore(max(1, self.settings.gmgn_max_concurrency))
+
+        async def fetch(addr: str) -> tuple[str, dict]:
+            async with sem:
+                stats = await gmgn.get_wallet_stats(addr)
+                await asyncio.sleep(self.settings.gmgn_request_interval)
+                return addr, stats
 
-        for i, addr in enumerate(addresses):
-            stats = await gmgn.get_wallet_stats(addr)
+        for i, task in enumerate(asyncio.as_completed([fetch(a) for a in addresses])):
+            addr, stats = await task
 
             profit_30d = _float(stats.get("realized_profit_30d"))
             winrate = stats.get("winrate")
-            tags = stats.get("tags") or []
-            if isinstance(tags, str):
-                import json
-                try:
-                    tags = json.loads(tags)
-                except (ValueError, TypeError):
-                    tags = []
+            tags = _parse_tags(stats.get("tags"))
 
             realized_profit = _float(stats.get("realized_profit"))
             sol_balance = _float(stats.get("sol_balance"))
             buy_30d = int(_float(stats.get("buy_30d")))
             sell_30d = int(_float(stats.get("sell_30d")))
 
-            # Save to fomo_traders table
-            await self.db.upsert_fomo_trader({
+            # Queue for the fomo_traders table
+            trader_rows.append({
                 "wallet_address": addr,
                 "platform": "fomo",
                 "pnl_30d_usd": profit_30d,
@@ -275,8 +323,8 @@ class FomoDiscoverer:
                 "notes": "auto-discovered on-chain",
             })
 
-            # Save to wallets table with GMGN enrichment + auto-monitor
-            wallet_data = {
+            # Queue for the wallets table with GMGN enrichment + auto-monitor
+            wallet_rows.append({
                 "address": addr,
                 "source": "fomo",
                 "total_score": 60,  # FOMO traders start higher
@@ -288,10 +336,13 @@ class FomoDiscoverer:
                 "gmgn_sell_30d": sell_30d,
                 "gmgn_tags": tags,
                 "is_monitored": True,
-            }
-            await self.db.upsert_wallet(wallet_data)
+            })
+
+            # GMGN is the slow part — flush in chunks so a crash mid-run
+            # keeps most of the work, without paying a commit per wallet
+            if len(wallet_rows) >= SAVE_BATCH_SIZE:
+                await self._flush_rows(trader_rows, wallet_rows)
 
-            wr_display = f"{_float(winrate)*100:.0f}%" if winrate is not None else "—"
             saved.append({
                 "address": addr,
                 "profit_30d": profit_30d,
@@ -302,32 +353,36 @@ class FomoDiscoverer:
 
             # Progress report every 10 wallets
             if (i + 1) % 10 == 0 or (i + 1) == total:
-                print(f"  Enriched {i+1}/{total} wallets...")
-
-            # Rate limiting for GMGN
-            await asyncio.sleep(0.5)
+                logger.info("fomo_enrich_progress", done=i + 1, total=total)
 
-        gmgn.close()
+        await self._flush_rows(trader_rows, wallet_rows)
         return saved
 
+    async def _flush_rows(self, trader_rows: list[dict], wallet_rows: list[dict]) -> None:
+        """Write queued fomo_traders + wallets rows in one transaction each, then clear the queues."""
+        await self.db.upsert_fomo_traders_bulk(trader_rows)
+        await self.db.upsert_wallets_bulk(wallet_rows)
+        trader_rows.clear()
+        wallet_rows.clear()
+
     async def _save_without_enrichment(self, addresses: list[str]) -> list[dict]:
         """Save wallets to DB without GMGN enrichment (fast mode)."""
-        saved = []
-        for addr in addresses:
-            await self.db.upsert_fomo_trader({
+        await self.db.upsert_fomo_traders_bulk([
+            {
                 "wallet_address": addr,
                 "platform": "fomo",
                 "is_tracked": True,
                 "notes": "auto-discovered on-chain (not enriched)",
-            })
-
-            await self.db.upsert_wallet({
+            }
+            for addr in addresses
+        ])
+        await self.db.upsert_wallets_bulk([
+            {
                 "address": addr,
                 "source": "fomo",
                 "total_score": 50,  # Lower score without GMGN data
                 "is_monitored": True,
-            })
-
-            saved.append({"address": addr})
-
-        return saved
+            }
+            for addr in addresses
+        ])
+        return [{"address": addr} for addr in addresses]
@@ -16,14 +16,16 @@ manual batch-add functionality that pairs with GMGN enrichment.
 Usage:
     client = FrontrunClient()
     full_address = await client.resolve_address("Abhxa...YsuS")
-    client.close()
+    await client.close()
 """
 
 import asyncio
 from typing import Any
 
 from curl_cffi import requests as curl_requests
+import orjson
 
+from utils.cache import TTLCache
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -33,7 +35,8 @@ class FrontrunClient:
     """
     Client for Frontrun Pro wallet resolution and discovery.
 
-    Uses curl_cffi with Chrome TLS impersonation for Cloudflare bypass.
+    Uses curl_cffi's AsyncSession with Chrome TLS impersonation for
+    Cloudflare bypass. Requests run on the event loop, not in worker threads.
     """
 
     BASE_URL = "https://www.frontrun.pro"
@@ -44,20 +47,33 @@ class FrontrunClient:
         "Referer": "https://www.frontrun.pro/address-finder",
         "Origin": "https://www.frontrun.pro",
     }
+    # Built once rather than merged on every _post
+    POST_HEADERS = {**HEADERS, "Content-Type": "application/json"}
+
+    # Address lookups in flight at once during batch_resolve
+    MAX_CONCURRENCY = 5
+    # Seconds each lookup slot stays held after its request (rate limit)
+    REQUEST_INTERVAL = 1.0
+    # Resolved addresses don't change, so keep them for a day. Misses are
+    # kept briefly so a failed lookup (or a Cloudflare hiccup) is retried soon.
+    RESOLVE_TTL = 24 * 60 * 60
+    RESOLVE_MISS_TTL = 10 * 60
+    RESOLVE_CACHE_SIZE = 10_000
 
     def __init__(self):
-        self._session = curl_requests.Session(impersonate="chrome")
+        self._session = curl_requests.AsyncSession(impersonate="chrome")
+        self._resolved = TTLCache(self.RESOLVE_TTL, self.RESOLVE_CACHE_SIZE)
+        self._unresolved = TTLCache(self.RESOLVE_MISS_TTL, self.RESOLVE_CACHE_SIZE)
 
-    def close(self):
+    async def close(self):
         """Clean up the curl_cffi session."""
         if self._session:
-            self._session.close()
+            await self._session.close()
 
     async def _get(self, url: str, params: dict | None = None) -> dict:
         """Make a GET request with Chrome TLS fingerprint."""
         try:
-            response = await asyncio.to_thread(
-                self._session.get,
+            response = await self._session.get(
                 url,
                 headers=self.HEADERS,
                 params=params,
@@ -65,8 +81,8 @@ class FrontrunClient:
             )
             if response.status_code == 200:
                 try:
-                    return response.json()
-                except Exception:
+                    return orjson.loads(response.content)
+                except orjson.JSONDecodeError:
                     return {"html": response.text}
             else:
                 logger.debug(
@@ -82,17 +98,16 @@ class FrontrunClient:
     async def _post(self, url: str, json_data: dict | None = None) -> dict:
         """Make a POST request with Chrome TLS fingerprint."""
         try:
-            response = await asyncio.to_thread(
-                self._session.post,
+            response = await self._session.post(
                 url,
-                headers={**self.HEADERS, "Content-Type": "application/json"},
+                headers=self.POST_HEADERS,
                 json=json_data,
                 timeout=15,
             )
             if response.status_code == 200:
                 try:
-                    return response.json()
-                except Exception:
+                    return orjson.loads(response.content)
+                except orjson.JSONDecodeError:
                     return {"html": response.text}
             else:
                 logger.debug(
@@ -114,8 +129,50 @@ class FrontrunClient:
         - A partial start/end snippet
         - A Twitter @handle
 
-        Returns the full address, or None if not found.
+        Returns the full address, or None if not found. Answers are cached
+        in-process (see RESOLVE_TTL / RESOLVE_MISS_TTL).
         """
+        hit, address = self._cached(partial_address)
+        if hit:
+            return address
+
+        address = await self._lookup_address(partial_address)
+        if address:
+            self._resolved.set(partial_address, address)
+        else:
+            self._unresolved.set(partial_address, None)
+        return address
+
+    # Where the address finder has been seen to put the result, in order
+    _ADDRESS_PATHS = (
+        ("address",),
+        ("wallet_address",),
+        ("result", "address"),
+        ("data", "address"),
+    )
+
+    @classmethod
+    def _find_address(cls, data: dict) -> str | None:
+        """First non-empty address at any of _ADDRESS_PATHS (None if none match)."""
+        for path in cls._ADDRESS_PATHS:
+            node: Any = data
+            for key in path:
+                node = node.get(key) if isinstance(node, dict) else None
+            if node:
+                return node
+        return None
+
+    def _cached(self, partial_address: str) -> tuple[bool, str | None]:
+        """Cached answer for a partial as (hit, address), without any request."""
+        hit, address = self._resolved.get(partial_address)
+        if hit:
+            return True, address
+        if self._unresolved.get(partial_address)[0]:
+            return True, None
+        return False, None
+
+    async def _lookup_address(self, partial_address: str) -> str | None:
+        """Query Frontrun's address finder, then its search endpoint, for a partial."""
         logger.info("frontrun_resolving", partial=partial_address)
 
         # Try the address finder API endpoint
@@ -125,13 +182,7 @@ class FrontrunClient:
         )
 
         if data and not data.get("html"):
-            # Check common response structures
-            address = (
-                data.get("address")
-                or data.get("wallet_address")
-                or data.get("result", {}).get("address")
-                or data.get("data", {}).get("address")
-            )
+            address = self._find_address(data)
             if address and len(address) >= 32:
                 logger.info("frontrun_resolved", partial=partial_address, full=address[:8])
                 return address
@@ -157,14 +208,24 @@ class FrontrunClient:
         """
         Resolve multiple truncated addresses.
 
+        Up to MAX_CONCURRENCY lookups run at once. Each slot is held for
+        REQUEST_INTERVAL after its request, so the request rate stays capped.
+
         Returns a dict mapping partial → full address (or None if not found).
         """
-        results = {}
-        for partial in partials:
-            full = await self.resolve_address(partial)
-            results[partial] = full
-            await asyncio.sleep(1)  # Rate limit
-        return results
+        sem = asyncio.Semaphore(self.MAX_CONCURRENCY)
+
+        async def resolve_one(partial: str) -> tuple[str, str | None]:
+            # Cache hits cost no request, so they don't take a rate-limited slot
+            hit, full = self._cached(partial)
+            if hit:
+                return partial, full
+            async with sem:
+                full = await self.resolve_address(partial)
+                await asyncio.sleep(self.REQUEST_INTERVAL)  # Rate limit
+                return partial, full
+
+        return dict(await asyncio.gather(*(resolve_one(p) for p in dict.fromkeys(partials))))
 
     @staticmethod
     def parse_fomo_leaderboard(raw_wallets: list[dict]) -> list[dict]:
@@ -22,20 +22,68 @@ API docs: https://www.geckoterminal.com/dex-api
 """
 
 import asyncio
+import random
+from dataclasses import asdict, dataclass
 from typing import Any
 
 import aiohttp
+import orjson
 
+from utils.cache import TTLCache
 from utils.logger import get_logger
+from utils.rate_limiter import AsyncRateLimiter, parse_retry_after
 
 logger = get_logger(__name__)
 
 
+@dataclass(slots=True)
+class GeckoPool:
+    """
+    One pool from a GeckoTerminal listing, flattened.
+    A slotted object instead of a dict: a listing pass holds hundreds of
+    these, and each one is about a quarter of the size of the equivalent dict.
+    Cached pool lists are shared between callers — treat them as read-only.
+    """
+    pool_address: str
+    pool_name: str
+    pool_created_at: str | None
+    # Token data from included
+    token_address: str
+    token_symbol: str
+    token_name: str
+    # Market data
+    price_usd: float = 0.0
+    fdv_usd: float = 0.0
+    market_cap_usd: float = 0.0
+    reserve_usd: float = 0.0
+    # Price changes across timeframes (percent)
+    price_change_m5: float = 0.0
+    price_change_m15: float = 0.0
+    price_change_m30: float = 0.0
+    price_change_h1: float = 0.0
+    price_change_h6: float = 0.0
+    price_change_h24: float = 0.0
+    # Volume
+    volume_h24: float = 0.0
+    volume_h6: float = 0.0
+    volume_h1: float = 0.0
+    # Transaction activity
+    buyers_h24: int = 0
+    sellers_h24: int = 0
+    # DEX info
+    dex_id: str = ""
+
+    def to_dict(self) -> dict[str, Any]:
+        """Plain dict of the fields, for callers that still want one."""
+        return asdict(self)
+
+
 class GeckoTerminalClient:
     """
     Client for the GeckoTerminal API.
 
     Usage:
+        session = GeckoTerminalClient.make_session()  # or pass your own
         client = GeckoTerminalClient(session)
         pools = await client.get_trending_pools()
         pools = await client.get_top_pools_by_volume()
@@ -48,79 +96,179 @@ class GeckoTerminalClient:
         "Accept": "application/json;version=20230302",
     }
 
+    # Pools per listing page; a shorter page is the last one
+    PAGE_SIZE = 20
+    # Max requests in flight at once
+    MAX_CONCURRENCY = 5
+    # GeckoTerminal's published budget — enforced by a token bucket in _get
+    RATE_LIMIT = 30
+    RATE_PERIOD = 60
+    # 429 handling: attempts, and backoff of BACKOFF_BASE * 2^n seconds
+    # (capped) when the server sends no Retry-After. A Retry-After longer
+    # than RETRY_AFTER_MAX gives up on the request instead of stalling.
+    MAX_RETRIES = 4
+    BACKOFF_BASE = 3
+    BACKOFF_CAP = 30
+    RETRY_AFTER_MAX = 60
+    # Pool lists per token change slowly — keep them for a few minutes
+    TOKEN_POOLS_TTL = 5 * 60
+    # Listing pages (trending/top volume/new) are cached briefly, and the
+    # last good copy of each is kept for STALE_TTL to serve if a refresh
+    # fails. Both live on the class, so they're shared by every client.
+    LISTING_TTL = 30
+    STALE_TTL = 10 * 60
+    _listing_cache = TTLCache(LISTING_TTL)
+    _listing_stale = TTLCache(STALE_TTL)
+
+    # Numeric pool fields: (output key, source, source key), where source
+    # 0 = pool attributes, 1 = price_change_percentage, 2 = volume_usd.
+    # Missing/empty values become 0.0.
+    _FLOAT_FIELDS = (
+        ("price_usd", 0, "base_token_price_usd"),
+        ("fdv_usd", 0, "fdv_usd"),
+        ("market_cap_usd", 0, "market_cap_usd"),
+        ("reserve_usd", 0, "reserve_in_usd"),
+        ("price_change_m5", 1, "m5"),
+        ("price_change_m15", 1, "m15"),
+        ("price_change_m30", 1, "m30"),
+        ("price_change_h1", 1, "h1"),
+        ("price_change_h6", 1, "h6"),
+        ("price_change_h24", 1, "h24"),
+        ("volume_h24", 2, "h24"),
+        ("volume_h6", 2, "h6"),
+        ("volume_h1", 2, "h1"),
+    )
+
     def __init__(self, session: aiohttp.ClientSession):
         self.session = session
+        self._sem = asyncio.Semaphore(self.MAX_CONCURRENCY)
+        self._limiter = AsyncRateLimiter(self.RATE_LIMIT, self.RATE_PERIOD)
+        self._token_pools_cache = TTLCache(self.TOKEN_POOLS_TTL)
+
+    @classmethod
+    def make_session(cls) -> aiohttp.ClientSession:
+        """
+        Build an aiohttp session tuned for bulk discovery.
+        Callers that don't already own a configured session should use this:
+        the pool limits are explicit instead of aiohttp's defaults, the
+        per-host cap stops one API from taking every connection, and DNS
+        lookups are cached across requests. A separate connect timeout makes
+        an unreachable host fail fast instead of using the whole budget.
+        """
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=200, limit_per_host=30, keepalive_timeout=30, ttl_dns_cache=300
+            ),
+            timeout=aiohttp.ClientTimeout(total=20, connect=10),
+        )
 
     async def _get(self, endpoint: str, params: dict | None = None) -> dict:
-        """Make a GET request to the GeckoTerminal API."""
+        """
+        Make a GET request to the GeckoTerminal API.
+        On 429, retries up to MAX_RETRIES times — after the server's
+        Retry-After if it sent one, else exponential backoff plus jitter —
+        then gives up and returns {}.
+        """
         url = f"{self.BASE_URL}{endpoint}"
-        try:
-            async with self.session.get(url, headers=self.HEADERS, params=params) as response:
-                if response.status == 200:
-                    return await response.json()
-                elif response.status == 429:
-                    logger.warning("geckoterminal_rate_limited", endpoint=endpoint)
-                    await asyncio.sleep(3)
-                    return await self._get(endpoint, params)
-                else:
-                    error_text = await response.text()
-                    logger.error("geckoterminal_error", status=response.status, endpoint=endpoint, error=error_text[:200])
-                    return {}
-        except Exception as e:
-            logger.error("geckoterminal_request_exception", endpoint=endpoint, error=str(e))
-            return {}
-
-    async def get_trending_pools(self, pages: int = 3) -> list[dict]:
+        for attempt in range(self.MAX_RETRIES):
+            # Every attempt (retries included) spends from the 30/min budget
+            await self._limiter.acquire()
+            try:
+                async with self._sem, self.session.get(url, headers=self.HEADERS, params=params) as response:
+                    if response.status == 200:
+                        return orjson.loads(await response.read())
+                    elif response.status != 429:
+                        error_text = await response.text()
+                        logger.error("geckoterminal_error", status=response.status, endpoint=endpoint, error=error_text[:200])
+                        return {}
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            except Exception as e:
+                logger.error("geckoterminal_request_exception", endpoint=endpoint, error=str(e))
+                return {}
+
+            # 429 — back off outside the semaphore so the slot is free meanwhile.
+            # Use the server's Retry-After when it sends one.
+            if retry_after is not None and retry_after > self.RETRY_AFTER_MAX:
+                logger.warning("geckoterminal_retry_after_too_long", endpoint=endpoint, retry_after=retry_after)
+                return {}
+            if retry_after is None:
+                delay = min(self.BACKOFF_CAP, self.BACKOFF_BASE * 2 ** attempt) + random.uniform(0, 1)
+            else:
+                delay = retry_after
+            logger.warning("geckoterminal_rate_limited", endpoint=endpoint, attempt=attempt + 1, delay=round(delay, 1))
+            await asyncio.sleep(delay)
+
+        logger.error("geckoterminal_retries_exhausted", endpoint=endpoint)
+        return {}
+
+    async def _paginate(self, endpoint: str, params: dict, pages: int) -> list[GeckoPool]:
         """
-        Get trending pools on Solana (most active/hot right now).
+        Fetch pages 1..pages of a pool listing and concatenate them.
 
-        Returns pools with price changes, volume, liquidity, and token info.
-        Each page returns ~20 pools.
+        Page 1 goes out alone as a probe. A short page (fewer than PAGE_SIZE
+        pools) is the last one, so nothing more is requested. Otherwise the
+        remaining pages are fetched concurrently; the rate limiter in _get
+        paces the burst, so there is no sleep between pages. Pages go through
+        _get_listing_page, so a repeat within LISTING_TTL is a cache hit.
         """
+        first = await self._get_listing_page(endpoint, params, 1)
+        results = [first]
+        if pages > 1 and len(first.get("data") or []) >= self.PAGE_SIZE:
+            results += await asyncio.gather(*(
+                self._get_listing_page(endpoint, params, page)
+                for page in range(2, pages + 1)
+            ))
         all_pools = []
-        for page in range(1, pages + 1):
-            data = await self._get(
-                "/networks/solana/trending_pools",
-                params={"include": "base_token", "page": str(page)},
-            )
-            pools = self._extract_pools(data)
-            all_pools.extend(pools)
+        for data in results:
+            all_pools.extend(self._extract_pools(data))
+        return all_pools
 
-            if not pools:
-                break
-            await asyncio.sleep(1)  # Rate limit: 30 req/min
+    async def _get_listing_page(self, endpoint: str, params: dict, page: int) -> dict:
+        """
+        One listing page, from the cache while it's fresh. If a refresh
+        fails, the last good copy (up to STALE_TTL old) is returned.
+        """
+        params = {**params, "page": str(page)}
+        key = (endpoint, tuple(sorted(params.items())))
+        data = await self._listing_cache.get_or_fetch(key, lambda: self._get(endpoint, params=params))
+        if data:
+            self._listing_stale.set(key, data)
+            return data
+        hit, stale = self._listing_stale.get(key)
+        if hit:
+            logger.warning("geckoterminal_serving_stale", endpoint=endpoint, page=page)
+            return stale
+        return data
+
+    async def get_trending_pools(self, pages: int = 3) -> list[GeckoPool]:
+        """
+        Get trending pools on Solana (most active/hot right now).
 
+        Returns pools with price changes, volume, liquidity, and token info.
+        Each page returns ~20 pools.
+        """
+        all_pools = await self._paginate(
+            "/networks/solana/trending_pools", {"include": "base_token"}, pages
+        )
         logger.info("geckoterminal_trending_fetched", count=len(all_pools))
         return all_pools
 
-    async def get_top_pools_by_volume(self, pages: int = 3) -> list[dict]:
+    async def get_top_pools_by_volume(self, pages: int = 3) -> list[GeckoPool]:
         """
         Get top Solana pools by 24h trading volume.
 
         High-volume pools are actively traded — good for finding tokens
         with enough liquidity for our copy trades.
         """
-        all_pools = []
-        for page in range(1, pages + 1):
-            data = await self._get(
-                "/networks/solana/pools",
-                params={
-                    "include": "base_token",
-                    "page": str(page),
-                    "sort": "h24_volume_usd_desc",
-                },
-            )
-            pools = self._extract_pools(data)
-            all_pools.extend(pools)
-
-            if not pools:
-                break
-            await asyncio.sleep(1)
-
+        all_pools = await self._paginate(
+            "/networks/solana/pools",
+            {"include": "base_token", "sort": "h24_volume_usd_desc"},
+            pages,
+        )
         logger.info("geckoterminal_volume_fetched", count=len(all_pools))
         return all_pools
 
-    async def get_new_pools(self, pages: int = 2) -> list[dict]:
+    async def get_new_pools(self, pages: int = 2) -> list[GeckoPool]:
         """
         Get recently created pools on Solana.
 
@@ -128,36 +276,36 @@ class GeckoTerminalClient:
         but also the highest risk. The wallet finder will determine
         which early buyers are legit.
         """
-        all_pools = []
-        for page in range(1, pages + 1):
-            data = await self._get(
-                "/networks/solana/new_pools",
-                params={"include": "base_token", "page": str(page)},
-            )
-            pools = self._extract_pools(data)
-            all_pools.extend(pools)
-
-            if not pools:
-                break
-            await asyncio.sleep(1)
-
+        all_pools = await self._paginate(
+            "/networks/solana/new_pools", {"include": "base_token"}, pages
+        )
         logger.info("geckoterminal_new_pools_fetched", count=len(all_pools))
         return all_pools
 
-    async def get_token_pools(self, token_address: str) -> list[dict]:
-        """Get all pools for a specific token."""
+    async def get_token_pools(self, token_address: str) -> list[GeckoPool]:
+        """
+        Get all pools for a specific token.
+        Cached per token for TOKEN_POOLS_TTL; concurrent calls for the same
+        token share one request.
+        """
+        return await self._token_pools_cache.get_or_fetch(
+            token_address, lambda: self._fetch_token_pools(token_address)
+        )
+
+    async def _fetch_token_pools(self, token_address: str) -> list[GeckoPool]:
+        """Uncached request behind get_token_pools."""
         data = await self._get(
             f"/networks/solana/tokens/{token_address}/pools",
             params={"include": "base_token"},
         )
         return self._extract_pools(data)
 
-    def _extract_pools(self, data: dict) -> list[dict]:
+    def _extract_pools(self, data: dict) -> list[GeckoPool]:
         """
         Extract pool data from GeckoTerminal API response.
 
         Combines the pool attributes with the included token data
-        to produce a clean, flat structure.
+        to produce a clean, flat GeckoPool per pool.
         """
         if not data:
             return []
@@ -170,59 +318,55 @@ class GeckoTerminalClient:
                 attrs = included.get("attributes", {})
                 token_map[token_id] = attrs
 
+        float_fields = self._FLOAT_FIELDS
         pools = []
         for item in data.get("data", []):
-            attrs = item.get("attributes", {})
-            relationships = item.get("relationships", {})
+            attrs = item.get("attributes") or {}
+            relationships = item.get("relationships") or {}
 
             # Get the base token info from the included data
-            base_token_ref = relationships.get("base_token", {}).get("data", {})
-            base_token_id = base_token_ref.get("id", "")
-            base_token = token_map.get(base_token_id, {})
+            base_token_ref = (relationships.get("base_token") or {}).get("data") or {}
+            base_token = token_map.get(base_token_ref.get("id", ""), {})
 
-            # Extract price change data
-            price_changes = attrs.get("price_change_percentage", {}) or {}
-            volumes = attrs.get("volume_usd", {}) or {}
-            transactions = attrs.get("transactions", {}) or {}
+            # Only include pools where we have the token address
+            token_address = base_token.get("address", "")
+            if not token_address:
+                continue
+
+            # Numeric sources, in the order _FLOAT_FIELDS indexes them
+            sources = (
+                attrs,
+                attrs.get("price_change_percentage") or {},
+                attrs.get("volume_usd") or {},
+            )
+            transactions = attrs.get("transactions") or {}
 
             # Calculate buyer count from transaction data (proxy for holder activity)
-            h24_txns = transactions.get("h24", {}) or {}
-            total_buyers = h24_txns.get("buyers", 0) or 0
-            total_sellers = h24_txns.get("sellers", 0) or 0
-
-            pool = {
-                "pool_address": attrs.get("address", ""),
-                "pool_name": attrs.get("name", ""),
-                "pool_created_at": attrs.get("pool_created_at"),
+            h24_txns = transactions.get("h24") or {}
+
+            # Market data, price changes and volume
+            numbers = {}
+            for dest, src, key in float_fields:
+                value = sources[src].get(key)
+                numbers[dest] = float(value) if value else 0.0
+            # Not every pool reports market cap — fall back to FDV
+            if not numbers["market_cap_usd"]:
+                numbers["market_cap_usd"] = numbers["fdv_usd"]
+
+            pools.append(GeckoPool(
+                pool_address=attrs.get("address", ""),
+                pool_name=attrs.get("name", ""),
+                pool_created_at=attrs.get("pool_created_at"),
                 # Token data from included
-                "token_address": base_token.get("address", ""),
-                "token_symbol": base_token.get("symbol", ""),
-                "token_name": base_token.get("name", ""),
-                # Market data
-                "price_usd": float(attrs.get("base_token_price_usd") or 0),
-                "fdv_usd": float(attrs.get("fdv_usd") or 0),
-                "market_cap_usd": float(attrs.get("market_cap_usd") or attrs.get("fdv_usd") or 0),
-                "reserve_usd": float(attrs.get("reserve_in_usd") or 0),
-                # Price changes across timeframes
-                "price_change_m5": float(price_changes.get("m5") or 0),
-                "price_change_m15": float(price_changes.get("m15") or 0),
-                "price_change_m30": float(price_changes.get("m30") or 0),
-                "price_change_h1": float(price_changes.get("h1") or 0),
-                "price_change_h6": float(price_changes.get("h6") or 0),
-                "price_change_h24": float(price_changes.get("h24") or 0),
-                # Volume
-                "volume_h24": float(volumes.get("h24") or 0),
-                "volume_h6": float(volumes.get("h6") or 0),
-                "volume_h1": float(volumes.get("h1") or 0),
+                token_address=token_address,
+                token_symbol=base_token.get("symbol", ""),
+                token_name=base_token.get("name", ""),
                 # Transaction activity
-                "buyers_h24": total_buyers,
-                "sellers_h24": total_sellers,
+                buyers_h24=h24_txns.get("buyers", 0) or 0,
+                sellers_h24=h24_txns.get("sellers", 0) or 0,
                 # DEX info
-                "dex_id": relationships.get("dex", {}).get("data", {}).get("id", ""),
-            }
-
-            # Only include pools where we have the token address
-            if pool["token_address"]:
-                pools.append(pool)
+                dex_id=((relationships.get("dex") or {}).get("data") or {}).get("id", ""),
+                **numbers,
+            ))
 
         return pools
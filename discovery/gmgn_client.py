@@ -22,14 +22,59 @@ browser DevTools (Application → Cookies → gmgn.ai). Cookies expire periodica
 """
 
 import asyncio
+import random
 from typing import Any
 
+from curl_cffi import CurlHttpVersion
 from curl_cffi import requests as curl_requests
+import orjson
 
+from utils.cache import TTLCache
 from utils.logger import get_logger
+from utils.rate_limiter import AdaptiveConcurrency, AsyncRateLimiter, parse_retry_after
 
 logger = get_logger(__name__)
 
+# Keys GMGN nests result lists under inside "data", in the order to try them
+_RANK_KEYS = ("rank",)
+_LEADERBOARD_KEYS = ("rank", "wallets", "list")
+
+# Wallet tags that disqualify a smart-money candidate (bots, known bad actors)
+BAD_TAGS = frozenset({
+    "sandwich_bot", "scammer", "rug_deployer", "sniper_bot", "mev_bot", "copy_bot", "arb_bot",
+})
+
+# Sniper bot platforms — profitable but uncopyable: they buy within
+# milliseconds of launch, way too fast for copy trading
+SNIPER_PLATFORMS = frozenset({"axiom", "photon", "bullx"})
+
+
+def _float(val) -> float:
+    """Safely convert a GMGN value to float (handles strings, None, "")."""
+    if not val:
+        return 0.0
+    try:
+        return float(val)
+    except (ValueError, TypeError):
+        return 0.0
+
+
+def _data_list(response: dict, keys: tuple[str, ...]) -> list:
+    """
+    Pull the result list out of a GMGN response in one walk.
+    "data" is either the list itself or a dict holding it under one of
+    `keys`. Anything else (missing, wrong type) gives [].
+    """
+    payload = response.get("data") if response else None
+    if isinstance(payload, list):
+        return payload
+    if isinstance(payload, dict):
+        for key in keys:
+            value = payload.get(key)
+            if value:
+                return value if isinstance(value, list) else []
+    return []
+
 
 class GMGNClient:
     """
@@ -42,7 +87,15 @@ class GMGNClient:
         client = GMGNClient(cf_clearance="...", cf_bm="...")
         tokens = await client.get_top_tokens("24h")
         buyers = await client.get_top_buyers("token_address_here")
-        client.close()
+        await client.close()
+
+        # Or scoped:
+        async with GMGNClient(cf_clearance="...") as client:
+            ...
+
+    Long-running code should use get_shared_client() instead: one client
+    per cookie pair keeps its TLS connection, Cloudflare session, caches
+    and rate state across every discovery pass.
     """
 
     BASE_URL = "https://gmgn.ai/defi/quotation/v1"
@@ -55,26 +108,91 @@ class GMGNClient:
         "Origin": "https://gmgn.ai",
     }
 
+    # 429/5xx handling: attempts, and backoff of BACKOFF_BASE * 2^n seconds
+    # (capped) when the server sends no Retry-After. A Retry-After longer
+    # than RETRY_AFTER_MAX gives up on the request instead of stalling.
+    MAX_RETRIES = 4
+    BACKOFF_BASE = 3
+    BACKOFF_CAP = 30
+    RETRY_AFTER_MAX = 60
+    RETRY_STATUSES = frozenset({500, 502, 503, 504})
+    # Wallet-stat lookups in flight at once in _enrich_and_filter
+    ENRICH_CONCURRENCY = 8
+    # Top-buyer lookups in flight at once in get_smart_money_wallets
+    TOP_BUYERS_CONCURRENCY = 5
+    # Request budget (per second), enforced by a token bucket in _get.
+    # GMGN publishes no limit, so the rate adapts: halved on every 429,
+    # nudged back up by RATE_STEP on every 200, within [MIN_RATE, RATE_LIMIT].
+    RATE_LIMIT = 10.0
+    MIN_RATE = 1.0
+    RATE_STEP = 0.1
+    # Response caches (seconds). Token info carries price and market cap,
+    # holder lists move fast, wallet PnL stats are fine for a few minutes
+    TOKEN_INFO_TTL = 5 * 60
+    TOP_BUYERS_TTL = 2 * 60
+    WALLET_STATS_TTL = 10 * 60
+
     def __init__(self, cf_clearance: str = "", cf_bm: str = "", **_kwargs):
         self.cf_clearance = cf_clearance
         self.cf_bm = cf_bm
-        # curl_cffi session with Chrome TLS fingerprint
-        self._session = curl_requests.Session(impersonate="chrome")
+        # Cloudflare cookies sent with every request — the values are fixed
+        # for the client's lifetime, so the dict is built once here
+        self._cookies = {}
+        if cf_clearance:
+            self._cookies["cf_clearance"] = cf_clearance
+        if cf_bm:
+            self._cookies["__cf_bm"] = cf_bm
+        # Native asyncio curl_cffi session with Chrome TLS fingerprint.
+        # max_clients matches the AIMD ceiling so curl never becomes the cap.
+        # HTTP/2 over TLS lets concurrent requests share one connection.
+        self._session = curl_requests.AsyncSession(
+            impersonate="chrome", max_clients=32, http_version=CurlHttpVersion.V2TLS
+        )
+        # Set by get_shared_client(); a shared client ignores close()
+        self._shared = False
+        self._token_info_cache = TTLCache(self.TOKEN_INFO_TTL)
+        self._limiter = AsyncRateLimiter(self.RATE_LIMIT)
+        # Requests in flight across every caller, tuned AIMD-style on the
+        # same signals as the rate (starts at 4, between 1 and 32)
+        self._concurrency = AdaptiveConcurrency(initial=4, minimum=1, maximum=32)
+        self._top_buyers_cache = TTLCache(self.TOP_BUYERS_TTL)
+        self._wallet_stats_cache = TTLCache(self.WALLET_STATS_TTL)
+
+    async def close(self):
+        """
+        Clean up the curl_cffi session.
+        A no-op for shared clients, so a caller finishing its own work
+        can't tear down the connection everyone else is using —
+        close_shared_clients() closes those at shutdown.
+        """
+        if self._session and not self._shared:
+            await self._session.close()
 
-    def close(self):
-        """Clean up the curl_cffi session."""
-        if self._session:
-            self._session.close()
+    async def __aenter__(self) -> "GMGNClient":
+        return self
 
-    @property
-    def _cookies(self) -> dict:
-        """Build Cloudflare cookies dict."""
-        cookies = {}
-        if self.cf_clearance:
-            cookies["cf_clearance"] = self.cf_clearance
-        if self.cf_bm:
-            cookies["__cf_bm"] = self.cf_bm
-        return cookies
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    def _adapt_rate(self, throttled: bool) -> None:
+        """
+        Additive increase on success, multiplicative decrease on 429/5xx —
+        applied to both the request rate and the in-flight cap.
+        """
+        rate = self._limiter.max_rate
+        if throttled:
+            new_rate = max(self.MIN_RATE, rate / 2)
+            self._concurrency.decrease()
+        else:
+            new_rate = min(self.RATE_LIMIT, rate + self.RATE_STEP)
+            self._concurrency.increase()
+        if new_rate != rate:
+            self._limiter.set_rate(new_rate)
+            if throttled:
+                logger.info(
+                    "gmgn_rate_reduced", rate=round(new_rate, 2),
+                    concurrency=self._concurrency.limit,
+                )
 
     @property
     def is_authenticated(self) -> bool:
@@ -85,37 +203,61 @@ class GMGNClient:
         """
         Make a GET request to the GMGN API.
 
-        Uses asyncio.to_thread to run the synchronous curl_cffi request
-        in a thread pool — keeps the rest of our async pipeline non-blocking.
+        Uses curl_cffi's AsyncSession (curl-multi on the event loop), so
+        requests don't tie up worker threads.
+        On 429 or a 5xx, retries up to MAX_RETRIES times — after the server's
+        Retry-After if it sent one, else exponential backoff plus jitter —
+        then gives up and returns {}.
         """
         url = f"{self.BASE_URL}{endpoint}"
-        try:
-            response = await asyncio.to_thread(
-                self._session.get,
-                url,
-                headers=self.HEADERS,
-                cookies=self._cookies,
-                params=params,
-                timeout=15,
-            )
+        for attempt in range(self.MAX_RETRIES):
+            await self._limiter.acquire()
+            try:
+                async with self._concurrency:
+                    response = await self._session.get(
+                        url,
+                        headers=self.HEADERS,
+                        cookies=self._cookies,
+                        params=params,
+                        timeout=15,
+                    )
+                status = response.status_code
+                if status == 200:
+                    self._adapt_rate(throttled=False)
+                    return orjson.loads(response.content)
+                elif status != 429 and status not in self.RETRY_STATUSES:
+                    logger.debug(
+                        "gmgn_blocked",
+                        status=status,
+                        endpoint=endpoint,
+                        note="Cloudflare — check cookies",
+                    )
+                    return {}
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            except Exception as e:
+                # Timeouts and connection errors are overload signals too
+                self._concurrency.decrease()
+                logger.error("gmgn_request_exception", endpoint=endpoint, error=str(e))
+                return {}
 
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 429:
-                logger.warning("gmgn_rate_limited", endpoint=endpoint)
-                await asyncio.sleep(3)
-                return await self._get(endpoint, params)
-            else:
-                logger.debug(
-                    "gmgn_blocked",
-                    status=response.status_code,
-                    endpoint=endpoint,
-                    note="Cloudflare — check cookies",
-                )
+            # 429 / 5xx — slow the whole client down, then wait as long as the
+            # server asked, or back off exponentially with jitter if it didn't
+            self._adapt_rate(throttled=True)
+            if retry_after is not None and retry_after > self.RETRY_AFTER_MAX:
+                logger.warning("gmgn_retry_after_too_long", endpoint=endpoint, retry_after=retry_after)
                 return {}
-        except Exception as e:
-            logger.error("gmgn_request_exception", endpoint=endpoint, error=str(e))
-            return {}
+            if retry_after is None:
+                delay = min(self.BACKOFF_CAP, self.BACKOFF_BASE * 2 ** attempt) + random.uniform(0, 1)
+            else:
+                delay = retry_after
+            logger.warning(
+                "gmgn_rate_limited", endpoint=endpoint, status=status,
+                attempt=attempt + 1, delay=round(delay, 1),
+            )
+            await asyncio.sleep(delay)
+
+        logger.error("gmgn_retries_exhausted", endpoint=endpoint)
+        return {}
 
     async def get_top_tokens(
         self,
@@ -160,14 +302,11 @@ class GMGNClient:
         if not data:
             return []
 
-        # GMGN wraps results in data.rank
-        rank_data = data.get("data", {}).get("rank", [])
-        if not rank_data:
-            # Some endpoints use different nesting
-            rank_data = data.get("data", [])
+        # GMGN wraps results in data.rank (some endpoints put the list at data)
+        rank_data = _data_list(data, _RANK_KEYS)
 
         logger.info("gmgn_tokens_fetched", timeframe=timeframe, count=len(rank_data))
-        return rank_data if isinstance(rank_data, list) else []
+        return rank_data
 
     async def get_top_buyers(self, token_address: str) -> list[dict]:
         """
@@ -182,7 +321,15 @@ class GMGNClient:
 
         Returns:
             List of holder dicts with wallet_address, status, tags.
+            Cached per token for TOP_BUYERS_TTL; concurrent calls for the
+            same token share one request.
         """
+        return await self._top_buyers_cache.get_or_fetch(
+            token_address, lambda: self._fetch_top_buyers(token_address)
+        )
+
+    async def _fetch_top_buyers(self, token_address: str) -> list[dict]:
+        """Uncached request behind get_top_buyers."""
         data = await self._get(f"/tokens/top_buyers/sol/{token_address}")
 
         if not data:
@@ -216,7 +363,15 @@ class GMGNClient:
 
         Returns:
             Wallet stats dict, or empty dict if not found.
+            Cached per wallet for WALLET_STATS_TTL; concurrent calls for the
+            same wallet share one request.
         """
+        return await self._wallet_stats_cache.get_or_fetch(
+            wallet_address, lambda: self._fetch_wallet_stats(wallet_address)
+        )
+
+    async def _fetch_wallet_stats(self, wallet_address: str) -> dict:
+        """Uncached request behind get_wallet_stats."""
         data = await self._get(f"/smartmoney/sol/walletNew/{wallet_address}")
 
         if not data:
@@ -246,8 +401,6 @@ class GMGNClient:
 
         Returns list of enriched wallet dicts that pass all filters.
         """
-        BAD_TAGS = {"sandwich_bot", "scammer", "rug_deployer", "sniper_bot", "mev_bot", "copy_bot", "arb_bot"}
-
         # --- Attempt 1: Try the leaderboard endpoint directly ---
         logger.info("smart_money_trying_leaderboard")
         leaderboard_data = await self._get(
@@ -255,14 +408,8 @@ class GMGNClient:
             params={"limit": "100", "orderby": "realized_profit_30d", "direction": "desc"},
         )
 
-        leaderboard_wallets = []
-        if leaderboard_data:
-            # Try different response structures
-            raw = leaderboard_data.get("data", {})
-            if isinstance(raw, list):
-                leaderboard_wallets = raw
-            elif isinstance(raw, dict):
-                leaderboard_wallets = raw.get("rank", []) or raw.get("wallets", []) or raw.get("list", [])
+        # Try different response structures
+        leaderboard_wallets = _data_list(leaderboard_data, _LEADERBOARD_KEYS)
 
         if leaderboard_wallets:
             logger.info("smart_money_leaderboard_hit", count=len(leaderboard_wallets))
@@ -275,18 +422,19 @@ class GMGNClient:
             if addresses:
                 return await self._enrich_and_filter(
                     addresses[:100], min_profit_30d, min_winrate,
-                    min_buys_30d, max_buys_30d, min_sol_balance, BAD_TAGS,
+                    min_buys_30d, max_buys_30d, min_sol_balance,
                 )
 
         # --- Attempt 2: Token-buyers approach ---
         logger.info("smart_money_using_token_buyers_approach")
 
-        # Get recent top-moving tokens across multiple timeframes
-        all_tokens = []
-        for tf in ["1h", "6h", "24h"]:
-            tokens = await self.get_top_tokens(tf, min_marketcap=100_000, min_liquidity=10_000)
-            all_tokens.extend(tokens)
-            await asyncio.sleep(0.5)
+        # Get recent top-moving tokens across multiple timeframes — the three
+        # queries are independent, so they go out together
+        results = await asyncio.gather(*(
+            self.get_top_tokens(tf, min_marketcap=100_000, min_liquidity=10_000)
+            for tf in ("1h", "6h", "24h")
+        ))
+        all_tokens = [t for tokens in results for t in tokens]
 
         if not all_tokens:
             logger.warning("smart_money_no_tokens_found")
@@ -294,30 +442,31 @@ class GMGNClient:
 
         logger.info("smart_money_tokens_fetched", count=len(all_tokens))
 
-        # Deduplicate tokens by address
-        seen_tokens = set()
-        unique_tokens = []
+        # Deduplicate tokens by address in one pass (first occurrence wins,
+        # dict keeps the order) and cap at 30 to keep API calls reasonable
+        unique_tokens = {}
         for t in all_tokens:
             addr = t.get("address") or t.get("mint") or t.get("token_address")
-            if addr and addr not in seen_tokens:
-                seen_tokens.add(addr)
-                unique_tokens.append(t)
-
-        # Cap at 30 tokens to keep API calls reasonable
-        unique_tokens = unique_tokens[:30]
-
-        # Get top buyers for each token
-        all_buyer_addresses = set()
-        for t in unique_tokens:
-            token_addr = t.get("address") or t.get("mint") or t.get("token_address")
-            if not token_addr:
-                continue
-            buyers = await self.get_top_buyers(token_addr)
-            for b in buyers:
-                addr = b.get("wallet_address") or b.get("address")
-                if addr:
-                    all_buyer_addresses.add(addr)
-            await asyncio.sleep(0.3)
+            if addr and addr not in unique_tokens:
+                unique_tokens[addr] = t
+        token_addrs = list(unique_tokens)[:30]
+
+        # Get top buyers for each token, TOP_BUYERS_CONCURRENCY at a time
+        sem = asyncio.Semaphore(self.TOP_BUYERS_CONCURRENCY)
+
+        async def fetch_buyers(token_addr: str) -> list[dict]:
+            async with sem:
+                return await self.get_top_buyers(token_addr)
+
+        buyer_lists = await asyncio.gather(*(fetch_buyers(a) for a in token_addrs))
+
+        # Buyer addresses, deduplicated in the order they were seen
+        all_buyer_addresses = dict.fromkeys(
+            addr
+            for buyers in buyer_lists
+            for b in buyers
+            if (addr := b.get("wallet_address") or b.get("address"))
+        )
 
         logger.info("smart_money_unique_buyers", count=len(all_buyer_addresses))
 
@@ -329,7 +478,7 @@ class GMGNClient:
 
         return await self._enrich_and_filter(
             buyer_list, min_profit_30d, min_winrate,
-            min_buys_30d, max_buys_30d, min_sol_balance, BAD_TAGS,
+            min_buys_30d, max_buys_30d, min_sol_balance,
         )
 
     async def _enrich_and_filter(
@@ -340,45 +489,36 @@ class GMGNClient:
         min_buys_30d: int,
         max_buys_30d: int,
         min_sol_balance: float,
-        bad_tags: set,
+        bad_tags: frozenset[str] = BAD_TAGS,
     ) -> list[dict]:
         """Enrich wallet addresses with stats and apply smart money filters."""
+        # Fetch every wallet's stats concurrently, ENRICH_CONCURRENCY at a time.
+        # The rate limiter in _get sets the overall pace.
+        sem = asyncio.Semaphore(self.ENRICH_CONCURRENCY)
 
-        def _float(val, default=0.0):
-            """Safely convert GMGN value to float (handles strings, None)."""
-            if val is None:
-                return default
-            try:
-                return float(val)
-            except (ValueError, TypeError):
-                return default
+        async def fetch_stats(addr: str) -> dict:
+            async with sem:
+                return await self.get_wallet_stats(addr)
+
+        all_stats = await asyncio.gather(*(fetch_stats(a) for a in addresses))
 
         passed = []
         total_checked = 0
 
-        for i, addr in enumerate(addresses):
-            stats = await self.get_wallet_stats(addr)
+        for addr, stats in zip(addresses, all_stats):
             if not stats:
-                await asyncio.sleep(0.3)
                 continue
 
             total_checked += 1
 
-            # Extract and safely convert all fields
-            profit_30d = _float(stats.get("realized_profit_30d"))
-            winrate = stats.get("winrate")  # Often None
-            buy_30d = int(_float(stats.get("buy_30d")))
-            sell_30d = int(_float(stats.get("sell_30d")))
-            sol_balance = _float(stats.get("sol_balance"))
-            tags = stats.get("tags") or []
-            if isinstance(tags, str):
-                try:
-                    import json
-                    tags = json.loads(tags)
-                except (json.JSONDecodeError, TypeError):
-                    tags = [tags] if tags else []
-
-            realized_profit = _float(stats.get("realized_profit"))
+            # Extract and safely convert all fields (one bound .get for all of them)
+            get = stats.get
+            profit_30d = _float(get("realized_profit_30d"))
+            winrate = get("winrate")  # Often None
+            buy_30d = int(_float(get("buy_30d")))
+            sell_30d = int(_float(get("sell_30d")))
+            sol_balance = _float(get("sol_balance"))
+            realized_profit = _float(get("realized_profit"))
 
             # --- Apply filters ---
 
@@ -393,8 +533,10 @@ class GMGNClient:
             # Filter 3: Winrate — reject if known-bad, skip if NULL
             # NULL winrate is common (GMGN only tracks it for their "smart money").
             # If winrate IS available and below threshold, reject.
-            if winrate is not None and _float(winrate) < min_winrate:
-                continue
+            if winrate is not None:
+                winrate = _float(winrate)
+                if winrate < min_winrate:
+                    continue
 
             # Filter 3b: Profit quality gate — minimum $20 profit per trade
             # This catches spray-and-pray snipers: $100K from 13K trades = $7/trade (fail)
@@ -413,16 +555,19 @@ class GMGNClient:
             if sol_balance < min_sol_balance:
                 continue
 
-            # Filter 6: No bad tags (bot platforms + known bad actors)
-            tag_set = set(t.lower().replace(" ", "_") for t in tags) if tags else set()
-            if tag_set & bad_tags:
-                continue
+            # Tags are only needed by the last two filters, so parse them
+            # after the cheap numeric checks have had a chance to reject
+            tags = get("tags") or []
+            if isinstance(tags, str):
+                try:
+                    tags = orjson.loads(tags)
+                except orjson.JSONDecodeError:
+                    tags = [tags] if tags else []
+            tag_set = frozenset(t.lower().replace(" ", "_") for t in tags)
 
+            # Filter 6: No bad tags (bot platforms + known bad actors)
             # Filter 7: No sniper bot platforms (axiom, photon, bullx)
-            # These are profitable but uncopyable — they buy tokens within
-            # milliseconds of launch, way too fast for copy trading.
-            SNIPER_PLATFORMS = {"axiom", "photon", "bullx"}
-            if tag_set & SNIPER_PLATFORMS:
+            if not tag_set.isdisjoint(bad_tags) or not tag_set.isdisjoint(SNIPER_PLATFORMS):
                 continue
 
             # Passed all filters — build wallet dict
@@ -431,7 +576,7 @@ class GMGNClient:
                 "gmgn_realized_profit_usd": realized_profit,
                 "gmgn_profit_30d_usd": profit_30d,
                 "gmgn_sol_balance": sol_balance,
-                "gmgn_winrate": _float(winrate) if winrate is not None else None,
+                "gmgn_winrate": winrate,
                 "gmgn_buy_30d": buy_30d,
                 "gmgn_sell_30d": sell_30d,
                 "gmgn_tags": tags,
@@ -441,8 +586,6 @@ class GMGNClient:
             if total_checked % 50 == 0:
                 logger.info("smart_money_progress", checked=total_checked, passed=len(passed))
 
-            await asyncio.sleep(0.5)  # Rate limiting
-
         logger.info(
             "smart_money_scan_complete",
             total_checked=total_checked,
@@ -462,6 +605,42 @@ class GMGNClient:
 
         Returns:
             Token info dict with price, market cap, safety data, etc.
+            Cached per token for TOKEN_INFO_TTL; concurrent calls for the
+            same token share one request.
         """
+        return await self._token_info_cache.get_or_fetch(
+            token_address, lambda: self._fetch_token_info(token_address)
+        )
+
+    async def _fetch_token_info(self, token_address: str) -> dict:
+        """Uncached request behind get_token_info."""
         data = await self._get(f"/tokens/sol/{token_address}")
         return data.get("data", {}) if data else {}
+
+
+# Long-lived clients, one per (cf_clearance, cf_bm) pair
+_shared_clients: dict[tuple[str, str], GMGNClient] = {}
+
+
+def get_shared_client(cf_clearance: str = "", cf_bm: str = "") -> GMGNClient:
+    """
+    Return the process-wide GMGNClient for these cookies, creating it once.
+    Reusing it keeps the TLS/HTTP2 connection, the Cloudflare session and
+    the response caches warm between discovery passes.
+    """
+    key = (cf_clearance, cf_bm)
+    client = _shared_clients.get(key)
+    if client is None:
+        client = GMGNClient(cf_clearance=cf_clearance, cf_bm=cf_bm)
+        client._shared = True
+        _shared_clients[key] = client
+    return client
+
+
+async def close_shared_clients() -> None:
+    """Close every shared client's session (call once at shutdown)."""
+    clients = list(_shared_clients.values())
+    _shared_clients.clear()
+    for client in clients:
+        if client._session:
+            await client._session.close()
@@ -13,6 +13,9 @@ this module provides deeper analysis:
 This runs after discovery to further refine our list.
 """
 
+import logging
+from bisect import bisect_left, bisect_right
+
 from config.settings import Settings
 from utils.logger import get_logger
 
@@ -28,6 +31,16 @@ class TokenFilter:
         filtered = tf.apply_filters(tokens)
     """
 
+    # score_token_quality tiers: (thresholds ascending, points per tier).
+    # Points has a leading 0 for "below the first threshold", so a bisect
+    # over the thresholds indexes it directly.
+    # Multiplier tiers are inclusive (>= 5x scores 10) ...
+    MULTIPLIER_TIERS = ((5, 10, 20, 50, 100), (0, 10, 15, 20, 25, 30))
+    # ... the rest are strict (> 0.05 volume/mcap scores 5)
+    VOLUME_RATIO_TIERS = ((0.05, 0.2, 0.5), (0, 5, 10, 15))
+    LIQUIDITY_TIERS = ((20_000, 50_000, 100_000), (0, 4, 7, 10))
+    HOLDER_TIERS = ((200, 1000, 5000), (0, 4, 7, 10))
+
     def __init__(self, settings: Settings):
         self.settings = settings
 
@@ -36,12 +49,16 @@ class TokenFilter:
         Run all quality filters on a list of tokens.
         Returns only tokens that pass all checks.
         """
+        # Checked once per batch: a per-token debug call costs more than the
+        # checks themselves, even when the event is then dropped
+        log_rejects = logging.getLogger(__name__).isEnabledFor(logging.DEBUG)
+        check = self.check_token_quality
         results = []
         for token in tokens:
-            issues = self.check_token_quality(token)
+            issues = check(token)
             if not issues:
                 results.append(token)
-            else:
+            elif log_rejects:
                 logger.debug(
                     "token_filtered_out",
                     symbol=token.get("symbol"),
@@ -119,42 +136,21 @@ class TokenFilter:
         holders = token.get("holder_count") or 0
 
         # Higher multiplier = more interesting (up to 30 points)
-        if multiplier >= 100:
-            score += 30
-        elif multiplier >= 50:
-            score += 25
-        elif multiplier >= 20:
-            score += 20
-        elif multiplier >= 10:
-            score += 15
-        elif multiplier >= 5:
-            score += 10
+        thresholds, points = self.MULTIPLIER_TIERS
+        score += points[bisect_right(thresholds, multiplier)]
 
         # Good volume/mcap ratio (up to 15 points)
         if mcap > 0 and volume > 0:
-            ratio = volume / mcap
-            if ratio > 0.5:
-                score += 15
-            elif ratio > 0.2:
-                score += 10
-            elif ratio > 0.05:
-                score += 5
+            thresholds, points = self.VOLUME_RATIO_TIERS
+            score += points[bisect_left(thresholds, volume / mcap)]
 
         # Good liquidity (up to 10 points)
-        if liquidity > 100_000:
-            score += 10
-        elif liquidity > 50_000:
-            score += 7
-        elif liquidity > 20_000:
-            score += 4
+        thresholds, points = self.LIQUIDITY_TIERS
+        score += points[bisect_left(thresholds, liquidity)]
 
         # Good holder distribution (up to 10 points)
-        if holders > 5000:
-            score += 10
-        elif holders > 1000:
-            score += 7
-        elif holders > 200:
-            score += 4
+        thresholds, points = self.HOLDER_TIERS
+        score += points[bisect_left(thresholds, holders)]
 
         # Sweet spot market cap bonus (up to 5 points)
         # $3M-$30M is the ideal range for finding alpha
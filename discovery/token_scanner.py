@@ -21,20 +21,36 @@ to refresh your token list.
 """
 
 import asyncio
+import logging
+import random
+import re
 from datetime import datetime, timezone, timedelta
 from typing import Any
 
 import aiohttp
+import orjson
 
 from config.settings import Settings
 from database.db import Database
-from discovery.gmgn_client import GMGNClient
-from discovery.geckoterminal_client import GeckoTerminalClient
+from discovery.gmgn_client import GMGNClient, get_shared_client
+from discovery.geckoterminal_client import GeckoPool, GeckoTerminalClient
+from utils.cache import TTLCache
 from utils.logger import get_logger
+from utils.rate_limiter import AsyncRateLimiter, parse_retry_after
 
 logger = get_logger(__name__)
 
 
+def _validators(headers) -> dict[str, str]:
+    """Conditional-request headers for revalidating a response later."""
+    found = {}
+    if etag := headers.get("ETag"):
+        found["If-None-Match"] = etag
+    if modified := headers.get("Last-Modified"):
+        found["If-Modified-Since"] = modified
+    return found
+
+
 class BirdeyeClient:
     """
     Client for the Birdeye API — our primary source for token data.
@@ -50,6 +66,45 @@ class BirdeyeClient:
 
     BASE_URL = "https://public-api.birdeye.so"
 
+    # Tokens per tokenlist page (Birdeye's maximum)
+    PAGE_SIZE = 50
+    # Max requests in flight at once
+    MAX_CONCURRENCY = 5
+    # Request budget (per second), enforced by a token bucket in _get —
+    # the pace the old fixed sleeps between calls worked out to
+    RATE_LIMIT = 2
+    # 429/5xx handling: attempts, and backoff of BACKOFF_BASE * 2^n seconds
+    # (capped, plus jitter) when the server sends no Retry-After. A
+    # Retry-After longer than RETRY_AFTER_MAX gives up instead of stalling.
+    MAX_RETRIES = 5
+    BACKOFF_BASE = 2
+    BACKOFF_CAP = 30
+    RETRY_AFTER_MAX = 60
+    RETRY_STATUSES = frozenset({500, 502, 503, 504})
+    # Response cache lifetime (seconds) per endpoint. Listings move fast,
+    # token data a bit slower, daily candles hardly at all. Endpoints not
+    # listed here aren't cached.
+    CACHE_TTLS = {
+        "/defi/tokenlist": 30,
+        "/defi/token_trending": 30,
+        "/defi/token_overview": 60,
+        "/defi/history_price": 5 * 60,
+    }
+    # The caches live on the class, so they are shared by every client and
+    # survive from one discovery run (and TokenScanner) to the next
+    _caches = {endpoint: TTLCache(ttl) for endpoint, ttl in CACHE_TTLS.items()}
+    # Last good answer per cached request, kept for STALE_TTL. When a
+    # refresh fails (429s or 5xx past the retries, an error status) the
+    # stale answer is served instead of nothing.
+    STALE_TTL = 10 * 60
+    _stale = TTLCache(STALE_TTL)
+    # The token list changes slowly. Once its cache entry expires, the last
+    # body is kept (for up to REVALIDATE_TTL) with its ETag/Last-Modified,
+    # and the next request is conditional — a 304 reuses it without a body.
+    REVALIDATE_ENDPOINTS = frozenset({"/defi/tokenlist"})
+    REVALIDATE_TTL = 10 * 60
+    _revalidate = TTLCache(REVALIDATE_TTL)
+
     def __init__(self, api_key: str, session: aiohttp.ClientSession):
         self.api_key = api_key
         self.session = session
@@ -57,22 +112,84 @@ class BirdeyeClient:
             "X-API-KEY": api_key,
             "x-chain": "solana",
         }
+        self._sem = asyncio.Semaphore(self.MAX_CONCURRENCY)
+        self._limiter = AsyncRateLimiter(self.RATE_LIMIT)
 
     async def _get(self, endpoint: str, params: dict | None = None) -> dict:
-        """Make a GET request to the Birdeye API."""
+        """
+        Make a GET request to the Birdeye API.
+        Endpoints in CACHE_TTLS are answered from the cache while fresh, and
+        concurrent identical requests share one round trip. If a refresh
+        fails, the last good answer (up to STALE_TTL old) is returned.
+        """
+        cache = self._caches.get(endpoint)
+        if cache is None:
+            return await self._request(endpoint, params)
+        key = (endpoint, tuple(sorted(params.items())) if params else ())
+        data = await cache.get_or_fetch(key, lambda: self._request(endpoint, params))
+        if data:
+            self._stale.set(key, data)
+            return data
+        hit, stale = self._stale.get(key)
+        if hit:
+            logger.warning("birdeye_serving_stale", endpoint=endpoint)
+            return stale
+        return data
+
+    async def _request(self, endpoint: str, params: dict | None = None) -> dict:
+        """
+        Uncached request behind _get.
+        On 429 or a 5xx, retries up to MAX_RETRIES times — after the server's
+        Retry-After if it sent one, else exponential backoff plus jitter —
+        then gives up and returns {}.
+        REVALIDATE_ENDPOINTS are requested conditionally when an earlier
+        body is on hand.
+        """
         url = f"{self.BASE_URL}{endpoint}"
-        async with self.session.get(url, headers=self.headers, params=params) as response:
-            if response.status == 200:
-                return await response.json()
-            elif response.status == 429:
-                # Rate limited — wait and retry
-                logger.warning("birdeye_rate_limited", endpoint=endpoint)
-                await asyncio.sleep(2)
-                return await self._get(endpoint, params)
-            else:
-                error_text = await response.text()
-                logger.error("birdeye_error", status=response.status, endpoint=endpoint, error=error_text)
+        headers = self.headers
+        stale_key = stale = None
+        if endpoint in self.REVALIDATE_ENDPOINTS:
+            stale_key = (endpoint, tuple(sorted(params.items())) if params else ())
+            _, stale = self._revalidate.get(stale_key)
+            if stale:
+                headers = {**headers, **stale[0]}
+        for attempt in range(self.MAX_RETRIES):
+            # Every attempt (retries included) spends from the rate budget
+            await self._limiter.acquire()
+            async with self._sem, self.session.get(url, headers=headers, params=params) as response:
+                status = response.status
+                if status == 200:
+                    data = orjson.loads(await response.read())
+                    if stale_key and (found := _validators(response.headers)):
+                        self._revalidate.set(stale_key, (found, data))
+                    return data
+                elif status == 304 and stale:
+                    # Still current — keep it for another REVALIDATE_TTL
+                    self._revalidate.set(stale_key, stale)
+                    return stale[1]
+                elif status != 429 and status not in self.RETRY_STATUSES:
+                    error_text = await response.text()
+                    logger.error("birdeye_error", status=status, endpoint=endpoint, error=error_text)
+                    return {}
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
+            # 429 / 5xx — back off outside the semaphore so the slot is free
+            # meanwhile, for as long as the server asked if it said
+            if retry_after is not None and retry_after > self.RETRY_AFTER_MAX:
+                logger.warning("birdeye_retry_after_too_long", endpoint=endpoint, retry_after=retry_after)
                 return {}
+            if retry_after is None:
+                delay = min(self.BACKOFF_CAP, self.BACKOFF_BASE * 2 ** attempt) + random.uniform(0, 0.5)
+            else:
+                delay = retry_after
+            logger.warning(
+                "birdeye_rate_limited", endpoint=endpoint, status=status,
+                attempt=attempt + 1, delay=round(delay, 1),
+            )
+            await asyncio.sleep(delay)
+
+        logger.error("birdeye_retries_exhausted", endpoint=endpoint)
+        return {}
 
     async def get_top_gainers(self, time_range: str = "24h", limit: int = 50) -> list[dict]:
         """
@@ -144,6 +261,9 @@ class BirdeyeClient:
             time_to: End time as Unix timestamp
         """
         now = int(datetime.now(timezone.utc).timestamp())
+        # Snap the default window to the cache lifetime so repeat lookups
+        # within it make the same request (and hit the cache)
+        now -= now % self.CACHE_TTLS["/defi/history_price"]
         params = {
             "address": token_address,
             "type": interval,
@@ -189,23 +309,109 @@ class DexScreenerClient:
 
     BASE_URL = "https://api.dexscreener.com"
 
+    # Max requests in flight at once
+    MAX_CONCURRENCY = 8
+    # Request budget (per second), enforced by a token bucket in _get.
+    # DexScreener allows 300/min on the pair endpoints; the boost listings
+    # are called once per run, so one shared budget is enough.
+    RATE_LIMIT = 5
+    # 429/5xx handling, as in BirdeyeClient. DexScreener's budget is per
+    # minute, so its backoff starts longer.
+    MAX_RETRIES = 5
+    BACKOFF_BASE = 5
+    BACKOFF_CAP = 30
+    RETRY_AFTER_MAX = 60
+    RETRY_STATUSES = frozenset({500, 502, 503, 504})
+    # Response cache lifetime (seconds) by endpoint prefix; others aren't cached
+    CACHE_TTLS = (
+        ("/token-boosts/", 60),
+        ("/tokens/v1/", 30),
+        ("/latest/dex/search", 30),
+    )
+    # Shared by every client, like BirdeyeClient's
+    _caches = [(prefix, TTLCache(ttl)) for prefix, ttl in CACHE_TTLS]
+    # Last good answer per cached endpoint, served when a refresh fails
+    STALE_TTL = 10 * 60
+    _stale = TTLCache(STALE_TTL)
+    # The boost listings are revalidated with conditional requests once
+    # their cache entry expires, as BirdeyeClient does for the token list
+    REVALIDATE_PREFIX = "/token-boosts/"
+    REVALIDATE_TTL = 10 * 60
+    _revalidate = TTLCache(REVALIDATE_TTL)
+
     def __init__(self, session: aiohttp.ClientSession):
         self.session = session
+        self._sem = asyncio.Semaphore(self.MAX_CONCURRENCY)
+        self._limiter = AsyncRateLimiter(self.RATE_LIMIT)
 
     async def _get(self, endpoint: str) -> dict | list:
-        """Make a GET request to the DexScreener API."""
+        """
+        Make a GET request to the DexScreener API.
+        Endpoints matching CACHE_TTLS are answered from the cache while
+        fresh, and concurrent identical requests share one round trip. If a
+        refresh fails, the last good answer (up to STALE_TTL old) is returned.
+        """
+        for prefix, cache in self._caches:
+            if endpoint.startswith(prefix):
+                break
+        else:
+            return await self._request(endpoint)
+        data = await cache.get_or_fetch(endpoint, lambda: self._request(endpoint))
+        if data:
+            self._stale.set(endpoint, data)
+            return data
+        hit, stale = self._stale.get(endpoint)
+        if hit:
+            logger.warning("dexscreener_serving_stale", endpoint=endpoint)
+            return stale
+        return data
+
+    async def _request(self, endpoint: str) -> dict | list:
+        """
+        Uncached request behind _get.
+        On 429 or a 5xx, retries up to MAX_RETRIES times (Retry-After, else
+        exponential backoff plus jitter), then gives up and returns {}.
+        """
         url = f"{self.BASE_URL}{endpoint}"
-        async with self.session.get(url) as response:
-            if response.status == 200:
-                return await response.json()
-            elif response.status == 429:
-                logger.warning("dexscreener_rate_limited", endpoint=endpoint)
-                await asyncio.sleep(5)
-                return await self._get(endpoint)
-            else:
-                error_text = await response.text()
-                logger.error("dexscreener_error", status=response.status, error=error_text)
+        revalidate = endpoint.startswith(self.REVALIDATE_PREFIX)
+        _, stale = self._revalidate.get(endpoint) if revalidate else (False, None)
+        headers = stale[0] if stale else None
+        for attempt in range(self.MAX_RETRIES):
+            await self._limiter.acquire()
+            async with self._sem, self.session.get(url, headers=headers) as response:
+                status = response.status
+                if status == 200:
+                    # orjson straight from the bytes — the search and boost
+                    # listings are the largest bodies discovery downloads
+                    data = orjson.loads(await response.read())
+                    if revalidate and (found := _validators(response.headers)):
+                        self._revalidate.set(endpoint, (found, data))
+                    return data
+                elif status == 304 and stale:
+                    self._revalidate.set(endpoint, stale)
+                    return stale[1]
+                elif status != 429 and status not in self.RETRY_STATUSES:
+                    error_text = await response.text()
+                    logger.error("dexscreener_error", status=status, error=error_text)
+                    return {}
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
+            # 429 / 5xx — back off outside the semaphore
+            if retry_after is not None and retry_after > self.RETRY_AFTER_MAX:
+                logger.warning("dexscreener_retry_after_too_long", endpoint=endpoint, retry_after=retry_after)
                 return {}
+            if retry_after is None:
+                delay = min(self.BACKOFF_CAP, self.BACKOFF_BASE * 2 ** attempt) + random.uniform(0, 0.5)
+            else:
+                delay = retry_after
+            logger.warning(
+                "dexscreener_rate_limited", endpoint=endpoint, status=status,
+                attempt=attempt + 1, delay=round(delay, 1),
+            )
+            await asyncio.sleep(delay)
+
+        logger.error("dexscreener_retries_exhausted", endpoint=endpoint)
+        return {}
 
     async def get_trending_tokens(self) -> list[dict]:
         """
@@ -219,9 +425,12 @@ class DexScreenerClient:
         """
         Get top trading pairs on Solana by volume/activity.
         Returns pairs with full metadata (price, volume, liquidity, etc.)
+        The search matches "solana" in any field, so pairs on other chains
+        are dropped here.
         """
         data = await self._get("/latest/dex/search?q=solana")
-        return data.get("pairs", []) if isinstance(data, dict) else []
+        pairs = data.get("pairs") if isinstance(data, dict) else None
+        return [p for p in pairs if p.get("chainId") == "solana"] if pairs else []
 
     async def search_token(self, query: str) -> list[dict]:
         """
@@ -254,9 +463,22 @@ class TokenScanner:
         await scanner.close()
     """
 
+    # Base/quote assets that show up as the "token" side of Gecko pools
+    GECKO_SKIP_SYMBOLS = frozenset({"SOL", "WSOL", "USDC", "USDT", "USDS", "DAI", "BUSD"})
+    # Tokens enriched from Birdeye at once in _enrich_tokens
+    ENRICH_CONCURRENCY = 10
+
+    # Symbol sanity patterns used by _filter_tokens, compiled once
+    SYMBOL_RE = re.compile(r'^[A-Za-z0-9$. ]{1,15}$')
+    ALNUM_LOWER_RE = re.compile(r'^[a-z0-9]+$')
+    CONSONANT_RUN_RE = re.compile(r'[bcdfghjklmnpqrstvwxyz]{3,}')
+    DIGIT_RUN_RE = re.compile(r'[0-9]{2,}')
+
     def __init__(self, settings: Settings, db: Database):
         self.settings = settings
         self.db = db
+        # token_blacklist is a list in Settings — hash it once for O(1) lookups
+        self._blacklist = frozenset(settings.token_blacklist)
         self.session: aiohttp.ClientSession | None = None
         self.birdeye: BirdeyeClient | None = None
         self.dexscreener: DexScreenerClient | None = None
@@ -264,20 +486,25 @@ class TokenScanner:
         self.gecko: GeckoTerminalClient | None = None
 
     async def initialize(self) -> None:
-        """Set up HTTP session and API clients."""
-        self.session = aiohttp.ClientSession()
+        """
+        Set up HTTP session and API clients.
+        Birdeye, DexScreener and GeckoTerminal share one tuned session, so
+        they share its keep-alive pool; each client paces itself.
+        """
+        self.session = GeckoTerminalClient.make_session()
         self.birdeye = BirdeyeClient(self.settings.birdeye_api_key, self.session)
         self.dexscreener = DexScreenerClient(self.session)
-        self.gmgn = GMGNClient(cf_clearance=self.settings.gmgn_cf_clearance, cf_bm=self.settings.gmgn_cf_bm)
+        self.gmgn = get_shared_client(cf_clearance=self.settings.gmgn_cf_clearance, cf_bm=self.settings.gmgn_cf_bm)
         self.gecko = GeckoTerminalClient(self.session)
         logger.info("token_scanner_initialized")
 
     async def close(self) -> None:
-        """Clean up HTTP sessions."""
+        """
+        Clean up the HTTP session. The GMGN client is the shared one —
+        close_shared_clients() closes it at shutdown.
+        """
         if self.session:
             await self.session.close()
-        if self.gmgn:
-            self.gmgn.close()
 
     async def run_discovery(self) -> list[dict]:
         """
@@ -294,26 +521,31 @@ class TokenScanner:
             market_cap_range=f"${self.settings.min_market_cap_usd/1e6:.0f}M-${self.settings.max_market_cap_usd/1e6:.0f}M",
         )
 
-        # Step 1: Gather token candidates from multiple sources
+        # Step 1: Gather token candidates from multiple sources.
+        # The sources are independent APIs on different hosts, each paced by
+        # its own client, so they're fetched concurrently. A source that
+        # fails is logged and skipped — the others still count.
+        # - GeckoTerminal (PRIMARY): trending + top volume pools. Free, no
+        #   auth, no Cloudflare. Returns pools with full price data.
+        # - DexScreener (SECONDARY): trending tokens
+        # - GMGN (OPTIONAL): only useful with cookie auth configured — it's
+        #   behind Cloudflare, so this silently comes back empty without them
+        sources = ("geckoterminal", "dexscreener", "gmgn")
+        results = await asyncio.gather(
+            self._fetch_geckoterminal_tokens(),
+            self._fetch_dexscreener_tokens(),
+            self._fetch_gmgn_tokens(),
+            return_exceptions=True,
+        )
         all_candidates = []
-
-        # Source 1 (PRIMARY): GeckoTerminal — trending + top volume pools
-        # Free, no auth, no Cloudflare. Returns pools with full price data.
-        gecko_tokens = await self._fetch_geckoterminal_tokens()
-        all_candidates.extend(gecko_tokens)
-        logger.info("geckoterminal_tokens_fetched", count=len(gecko_tokens))
-
-        # Source 2 (SECONDARY): DexScreener trending tokens
-        dex_tokens = await self._fetch_dexscreener_tokens()
-        all_candidates.extend(dex_tokens)
-        logger.info("dexscreener_tokens_fetched", count=len(dex_tokens))
-
-        # Source 3 (OPTIONAL): GMGN — only if we have cookie auth configured
-        # GMGN is behind Cloudflare, so this will silently fail without cookies
-        gmgn_tokens = await self._fetch_gmgn_tokens()
-        if gmgn_tokens:
-            all_candidates.extend(gmgn_tokens)
-            logger.info("gmgn_tokens_fetched", count=len(gmgn_tokens))
+        for source, result in zip(sources, results):
+            if isinstance(result, Exception):
+                logger.error("source_fetch_failed", source=source, error=str(result))
+                continue
+            # GMGN is only logged when it found something (see above)
+            if result or source != "gmgn":
+                logger.info(f"{source}_tokens_fetched", count=len(result))
+            all_candidates.extend(result)
 
         # Step 2: Deduplicate by mint address
         unique_tokens = self._deduplicate(all_candidates)
@@ -326,11 +558,8 @@ class TokenScanner:
         # Step 4: Sort by performance (best first)
         qualifying.sort(key=lambda t: t.get("price_multiplier") or 0, reverse=True)
 
-        # Step 5: Save to database
-        saved_count = 0
-        for token in qualifying:
-            await self.db.insert_token(token)
-            saved_count += 1
+        # Step 5: Save to database (one transaction for the whole batch)
+        saved_count = await self.db.insert_tokens_bulk(qualifying)
 
         logger.info("discovery_complete", tokens_found=len(qualifying), saved=saved_count)
 
@@ -345,26 +574,33 @@ class TokenScanner:
         We pull tokens sorted by volume (active tokens are more interesting)
         and by market cap within our range.
         """
-        tokens = []
+        page_size = BirdeyeClient.PAGE_SIZE
 
-        # Fetch tokens sorted by 24h volume (most active first)
-        for offset in range(0, self.settings.max_discovery_tokens, 50):
-            batch = await self.birdeye.get_token_list(
+        async def fetch_page(offset: int) -> list[dict]:
+            # Tokens sorted by 24h volume (most active first). Each page is
+            # normalized as soon as it lands, while slower pages are still
+            # in flight (one token out per token in).
+            raw = await self.birdeye.get_token_list(
                 sort_by="v24hUSD",
                 sort_type="desc",
                 min_market_cap=self.settings.min_market_cap_usd,
                 max_market_cap=self.settings.max_market_cap_usd,
-                limit=50,
+                limit=page_size,
                 offset=offset,
             )
-            if not batch:
-                break
-
-            for t in batch:
-                tokens.append(self._normalize_birdeye_token(t))
-
-            # Small delay to respect rate limits
-            await asyncio.sleep(0.5)
+            return [self._normalize_birdeye_token(t) for t in raw]
+
+        # The first page goes out alone: a short page means there's nothing
+        # more to fetch. Otherwise the remaining pages go out together and
+        # the client's rate limiter paces them.
+        offsets = range(0, self.settings.max_discovery_tokens, page_size)
+        if not offsets:
+            return []
+        tokens = await fetch_page(offsets[0])
+        if len(offsets) > 1 and len(tokens) >= page_size:
+            # gather keeps the pages in volume order
+            for page in await asyncio.gather(*(fetch_page(o) for o in offsets[1:])):
+                tokens.extend(page)
 
         return tokens
 
@@ -384,23 +620,23 @@ class TokenScanner:
 
         # Get trending pools (3 pages = ~60 pools)
         trending = await self.gecko.get_trending_pools(pages=3)
-        for pool in trending:
-            normalized = self._normalize_gecko_pool(pool)
-            if normalized and normalized["mint_address"] not in seen_mints:
-                seen_mints.add(normalized["mint_address"])
-                tokens.append(normalized)
-
         # Get top volume pools (3 pages = ~60 pools)
         top_volume = await self.gecko.get_top_pools_by_volume(pages=3)
-        for pool in top_volume:
+
+        # One pass over both lists. Check the mint before normalizing, so a
+        # pool whose token is already in the list isn't converted just to be dropped
+        for pool in (*trending, *top_volume):
+            mint = pool.token_address
+            if mint in seen_mints:
+                continue
             normalized = self._normalize_gecko_pool(pool)
-            if normalized and normalized["mint_address"] not in seen_mints:
-                seen_mints.add(normalized["mint_address"])
+            if normalized:
+                seen_mints.add(mint)
                 tokens.append(normalized)
 
         return tokens
 
-    def _normalize_gecko_pool(self, pool: dict) -> dict | None:
+    def _normalize_gecko_pool(self, pool: GeckoPool) -> dict | None:
         """
         Convert GeckoTerminal pool data to our standard token format.
 
@@ -408,24 +644,24 @@ class TokenScanner:
         We also use the best of h6 and h24 to calculate the multiplier,
         since some tokens may have pumped within a shorter window.
         """
-        token_address = pool.get("token_address", "")
-        symbol = pool.get("token_symbol", "")
+        token_address = pool.token_address
+        symbol = pool.token_symbol
         if not token_address or not symbol:
             return None
 
         # Skip wrapped SOL, USDC, USDT and other stables
-        if symbol.upper() in {"SOL", "WSOL", "USDC", "USDT", "USDS", "DAI", "BUSD"}:
+        if symbol.upper() in self.GECKO_SKIP_SYMBOLS:
             return None
 
-        market_cap = pool.get("market_cap_usd") or pool.get("fdv_usd") or 0
-        liquidity = pool.get("reserve_usd") or 0
-        volume = pool.get("volume_h24") or 0
-        price = pool.get("price_usd") or 0
+        market_cap = pool.market_cap_usd or pool.fdv_usd
+        liquidity = pool.reserve_usd
+        volume = pool.volume_h24
+        price = pool.price_usd
 
         # Use the best price change to calculate multiplier
         # A token might have pumped in 6h and leveled off in 24h
-        h24_change = pool.get("price_change_h24") or 0
-        h6_change = pool.get("price_change_h6") or 0
+        h24_change = pool.price_change_h24
+        h6_change = pool.price_change_h6
         best_change = max(h24_change, h6_change)
 
         # Convert percentage to multiplier (e.g., 500% = 6x)
@@ -434,16 +670,16 @@ class TokenScanner:
         return {
             "mint_address": token_address,
             "symbol": symbol,
-            "name": pool.get("token_name") or symbol,
+            "name": pool.token_name or symbol,
             "market_cap_usd": market_cap,
             "price_usd": price,
             "price_change_pct": h24_change,
             "price_multiplier": multiplier if multiplier > 1 else None,
             "volume_24h_usd": volume,
             "liquidity_usd": liquidity,
-            "holder_count": pool.get("buyers_h24") or 0,  # Proxy: unique buyers in 24h
-            "pair_address": pool.get("pool_address"),
-            "dex_name": pool.get("dex_id"),
+            "holder_count": pool.buyers_h24,  # Proxy: unique buyers in 24h
+            "pair_address": pool.pool_address,
+            "dex_name": pool.dex_id,
             "data_source": "geckoterminal",
         }
 
@@ -475,9 +711,6 @@ class TokenScanner:
                     seen_mints.add(normalized["mint_address"])
                     tokens.append(normalized)
 
-            # Small delay between timeframe calls
-            await asyncio.sleep(0.5)
-
         return tokens
 
     def _normalize_gmgn_token(self, raw: dict) -> dict | None:
@@ -502,12 +735,10 @@ class TokenScanner:
             return None
 
         # Extract price change and convert to multiplier
-        price_change_pct = raw.get("price_change_percent") or raw.get("price_change_percent1h") or 0
-        if isinstance(price_change_pct, str):
-            try:
-                price_change_pct = float(price_change_pct)
-            except (ValueError, TypeError):
-                price_change_pct = 0
+        try:
+            price_change_pct = float(raw.get("price_change_percent") or raw.get("price_change_percent1h") or 0)
+        except (ValueError, TypeError):
+            price_change_pct = 0.0
 
         # Convert percentage to multiplier (e.g., 500% change = 6x)
         multiplier = 1 + (price_change_pct / 100) if price_change_pct else 0
@@ -521,11 +752,11 @@ class TokenScanner:
 
         # Ensure numeric types
         try:
-            market_cap = float(market_cap) if market_cap else 0
-            liquidity = float(liquidity) if liquidity else 0
-            volume = float(volume) if volume else 0
-            price = float(price) if price else 0
-            holders = int(holders) if holders else 0
+            market_cap = float(market_cap)
+            liquidity = float(liquidity)
+            volume = float(volume)
+            price = float(price)
+            holders = int(holders)
         except (ValueError, TypeError):
             return None
 
@@ -557,44 +788,50 @@ class TokenScanner:
         Fetch trending/boosted tokens from DexScreener.
         Filter to Solana tokens within our market cap range.
         """
-        tokens = []
-
-        # Get trending tokens
+        # Get trending tokens (Solana only)
         trending = await self.dexscreener.get_trending_tokens()
-        for t in trending:
-            # Only Solana tokens
-            if t.get("chainId") != "solana":
-                continue
-            # Get full pair data for this token
-            pairs = await self.dexscreener.get_token_pairs(t.get("tokenAddress", ""))
-            if pairs:
-                # Use the pair with the highest liquidity
-                best_pair = max(pairs, key=lambda p: float(p.get("liquidity", {}).get("usd", 0) or 0))
-                normalized = self._normalize_dexscreener_pair(best_pair)
-                if normalized:
-                    tokens.append(normalized)
-
-            await asyncio.sleep(0.3)  # Rate limiting
-
-        return tokens
+        addresses = [
+            t["tokenAddress"] for t in trending
+            if t.get("chainId") == "solana" and t.get("tokenAddress")
+        ]
+
+        async def fetch_token(address: str) -> dict | None:
+            # Picked and normalized as soon as its pairs arrive, while the
+            # other lookups are still in flight
+            pairs = await self.dexscreener.get_token_pairs(address)
+            if not pairs:
+                return None
+            # Use the pair with the highest liquidity
+            best_pair = max(pairs, key=lambda p: float(p.get("liquidity", {}).get("usd", 0) or 0))
+            return self._normalize_dexscreener_pair(best_pair)
+
+        # Get full pair data for every token at once — the client's
+        # semaphore and rate limiter pace the requests. A lookup that fails
+        # (timeout, dropped connection) only loses that one token.
+        results = await asyncio.gather(*(fetch_token(a) for a in addresses), return_exceptions=True)
+        failed = sum(isinstance(r, Exception) for r in results)
+        if failed:
+            logger.warning("dexscreener_pair_lookups_failed", failed=failed, total=len(results))
+        return [t for t in results if t and not isinstance(t, Exception)]
 
     def _normalize_birdeye_token(self, raw: dict) -> dict:
         """
         Convert Birdeye's token format to our standard format.
         Different APIs return data in different formats, so we normalize
-        everything to a single format before processing.
+        everything to a single format before processing. Numeric fields are
+        always numbers (0 when missing), so later stages can read them as-is.
         """
         return {
             "mint_address": raw.get("address", ""),
             "symbol": raw.get("symbol", "UNKNOWN"),
             "name": raw.get("name", ""),
-            "market_cap_usd": raw.get("mc") or raw.get("market_cap") or 0,
-            "price_usd": raw.get("price") or raw.get("lastTradeUnixTime") or 0,
-            "price_change_pct": raw.get("priceChange24hPercent") or raw.get("price_change_24h_percent") or 0,
+            "market_cap_usd": float(raw.get("mc") or raw.get("market_cap") or 0),
+            "price_usd": float(raw.get("price") or raw.get("lastTradeUnixTime") or 0),
+            "price_change_pct": float(raw.get("priceChange24hPercent") or raw.get("price_change_24h_percent") or 0),
             "price_multiplier": None,  # Will be calculated during enrichment
-            "volume_24h_usd": raw.get("v24hUSD") or raw.get("volume_24h") or 0,
-            "liquidity_usd": raw.get("liquidity") or 0,
-            "holder_count": raw.get("holder") or 0,
+            "volume_24h_usd": float(raw.get("v24hUSD") or raw.get("volume_24h") or 0),
+            "liquidity_usd": float(raw.get("liquidity") or 0),
+            "holder_count": int(raw.get("holder") or 0),
             "pair_address": None,
             "dex_name": None,
             "data_source": "birdeye",
@@ -635,68 +872,82 @@ class TokenScanner:
     def _deduplicate(self, tokens: list[dict]) -> list[dict]:
         """
         Remove duplicate tokens (same mint address from different sources).
-        When there's a duplicate, keep the one with more complete data.
+        When there's a duplicate, the record with the higher market cap is
+        kept as the base, and any field it's missing (None/0/empty) is filled
+        from the other — so e.g. a DexScreener pair keeps GMGN's safety data.
         """
         seen = {}
         for token in tokens:
             mint = token.get("mint_address")
             if not mint:
                 continue
-            if mint not in seen:
+            existing = seen.get(mint)
+            if existing is None:
                 seen[mint] = token
+                continue
+            if token["market_cap_usd"] > existing["market_cap_usd"]:
+                base, other = token, existing
             else:
-                # Keep the one with more data (higher market cap or more fields filled)
-                existing = seen[mint]
-                if (token.get("market_cap_usd") or 0) > (existing.get("market_cap_usd") or 0):
-                    seen[mint] = token
+                base, other = existing, token
+            merged = dict(base)
+            for key, value in other.items():
+                if value and not merged.get(key):
+                    merged[key] = value
+            seen[mint] = merged
         return list(seen.values())
 
     async def _enrich_tokens(self, tokens: list[dict]) -> list[dict]:
         """
         Add missing data to tokens using Birdeye's detailed token overview.
         Most importantly, calculate the price_multiplier (how many X the token did).
+
+        Tokens are enriched concurrently, ENRICH_CONCURRENCY at a time; the
+        Birdeye client's rate limiter sets the overall pace.
         """
-        enriched = []
-        for token in tokens:
-            mint = token["mint_address"]
+        sem = asyncio.Semaphore(self.ENRICH_CONCURRENCY)
 
-            # If we don't have a price multiplier, try to calculate it
-            if not token.get("price_multiplier"):
-                try:
-                    # Get price history to calculate the actual multiplier
-                    history = await self.birdeye.get_token_price_history(
-                        mint,
-                        interval="1D",
-                    )
-                    if history and len(history) >= 2:
-                        # Find the lowest price in our lookback period
-                        prices = [candle.get("value", 0) for candle in history if candle.get("value", 0) > 0]
-                        if prices:
-                            min_price = min(prices)
-                            current_price = token.get("price_usd") or prices[-1]
-                            if min_price > 0:
-                                token["price_multiplier"] = current_price / min_price
-
-                    await asyncio.sleep(0.3)  # Rate limiting
-                except Exception as e:
-                    logger.debug("enrichment_error", token=token.get("symbol"), error=str(e))
-
-            # If we still don't have enough data, try getting the overview
-            if not token.get("market_cap_usd") or not token.get("liquidity_usd"):
-                try:
-                    overview = await self.birdeye.get_token_overview(mint)
-                    if overview:
-                        token["market_cap_usd"] = token.get("market_cap_usd") or overview.get("mc", 0)
-                        token["liquidity_usd"] = token.get("liquidity_usd") or overview.get("liquidity", 0)
-                        token["holder_count"] = token.get("holder_count") or overview.get("holder", 0)
-                        token["price_usd"] = token.get("price_usd") or overview.get("price", 0)
-                    await asyncio.sleep(0.3)
-                except Exception as e:
-                    logger.debug("overview_error", token=token.get("symbol"), error=str(e))
+        async def enrich(token: dict) -> dict:
+            async with sem:
+                await self._enrich_token(token)
+            return token
 
-            enriched.append(token)
+        return list(await asyncio.gather(*(enrich(t) for t in tokens)))
 
-        return enriched
+    async def _enrich_token(self, token: dict) -> None:
+        """Fill in one token's multiplier and market data from Birdeye, in place."""
+        mint = token["mint_address"]
+
+        # If we don't have a price multiplier, try to calculate it
+        if not token.get("price_multiplier"):
+            try:
+                # Get price history to calculate the actual multiplier
+                history = await self.birdeye.get_token_price_history(
+                    mint,
+                    interval="1D",
+                )
+                if history and len(history) >= 2:
+                    # Find the lowest price in our lookback period
+                    # (one .get per candle)
+                    prices = [v for candle in history if (v := candle.get("value", 0)) > 0]
+                    if prices:
+                        min_price = min(prices)
+                        current_price = token.get("price_usd") or prices[-1]
+                        if min_price > 0:
+                            token["price_multiplier"] = current_price / min_price
+            except Exception as e:
+                logger.debug("enrichment_error", token=token.get("symbol"), error=str(e))
+
+        # If we still don't have enough data, try getting the overview
+        if not token["market_cap_usd"] or not token["liquidity_usd"]:
+            try:
+                overview = await self.birdeye.get_token_overview(mint)
+                if overview:
+                    token["market_cap_usd"] = token["market_cap_usd"] or float(overview.get("mc") or 0)
+                    token["liquidity_usd"] = token["liquidity_usd"] or float(overview.get("liquidity") or 0)
+                    token["holder_count"] = token["holder_count"] or int(overview.get("holder") or 0)
+                    token["price_usd"] = token["price_usd"] or float(overview.get("price") or 0)
+            except Exception as e:
+                logger.debug("overview_error", token=token.get("symbol"), error=str(e))
 
     def _filter_tokens(self, tokens: list[dict]) -> list[dict]:
         """
@@ -710,49 +961,64 @@ class TokenScanner:
         - GMGN safety checks: rug_ratio, wash trading, bundler rate
         - Not on blacklist
         """
-        import re
+        # Settings don't change during the pass — read them once
+        blacklist = self._blacklist
+        min_mcap = self.settings.min_market_cap_usd
+        max_mcap = self.settings.max_market_cap_usd
+        min_multiplier = self.settings.min_price_multiplier
+        # Checked once per pass: most tokens get rejected, and a debug call
+        # per rejection costs more than the checks themselves even when the
+        # event is then dropped
+        log_rejects = logging.getLogger(__name__).isEnabledFor(logging.DEBUG)
+
         qualifying = []
         for token in tokens:
             mint = token.get("mint_address", "")
             symbol = token.get("symbol", "")
             name = token.get("name", "")
-            mcap = token.get("market_cap_usd") or 0
-            multiplier = token.get("price_multiplier") or 0
-            liquidity = token.get("liquidity_usd") or 0
-            holders = token.get("holder_count") or 0
-            volume = token.get("volume_24h_usd") or 0
+            # Normalizers store numbers (0 when missing); only the
+            # multiplier can still be None before enrichment
+            mcap = token["market_cap_usd"]
+            multiplier = token["price_multiplier"] or 0
+            liquidity = token["liquidity_usd"]
+            volume = token["volume_24h_usd"]
 
             # Skip blacklisted tokens
-            if mint in self.settings.token_blacklist:
-                logger.debug("token_filtered", symbol=symbol, reason="blacklisted")
+            if mint in blacklist:
+                if log_rejects:
+                    logger.debug("token_filtered", symbol=symbol, reason="blacklisted")
                 continue
 
             # Market cap filter
-            if mcap < self.settings.min_market_cap_usd or mcap > self.settings.max_market_cap_usd:
+            if mcap < min_mcap or mcap > max_mcap:
                 continue
 
             # MUST have price multiplier data — no N/A tokens
             if not multiplier or multiplier <= 0:
-                logger.debug("token_filtered", symbol=symbol, reason="no_multiplier_data")
+                if log_rejects:
+                    logger.debug("token_filtered", symbol=symbol, reason="no_multiplier_data")
                 continue
 
             # Minimum performance filter
-            if multiplier < self.settings.min_price_multiplier:
+            if multiplier < min_multiplier:
                 continue
 
             # Minimum liquidity — $25K floor to ensure we can actually sell
             if liquidity < 25_000:
-                logger.debug("token_filtered", symbol=symbol, reason=f"low_liquidity_${liquidity:.0f}")
+                if log_rejects:
+                    logger.debug("token_filtered", symbol=symbol, reason=f"low_liquidity_${liquidity:.0f}")
                 continue
 
             # Liquidity-to-mcap ratio — rugs have huge mcap but tiny liquidity
             if mcap > 0 and (liquidity / mcap) < 0.005:
-                logger.debug("token_filtered", symbol=symbol, reason=f"bad_liq_ratio_{liquidity/mcap:.4f}")
+                if log_rejects:
+                    logger.debug("token_filtered", symbol=symbol, reason=f"bad_liq_ratio_{liquidity/mcap:.4f}")
                 continue
 
             # Minimum 24h volume — dead tokens aren't interesting
             if volume < 10_000:
-                logger.debug("token_filtered", symbol=symbol, reason=f"low_volume_${volume:.0f}")
+                if log_rejects:
+                    logger.debug("token_filtered", symbol=symbol, reason=f"low_volume_${volume:.0f}")
                 continue
 
             # === GMGN Safety Checks (when available) ===
@@ -761,40 +1027,45 @@ class TokenScanner:
             if rug_ratio is not None:
                 try:
                     if float(rug_ratio) > 0.5:
-                        logger.debug("token_filtered", symbol=symbol, reason=f"high_rug_ratio_{rug_ratio}")
+                        if log_rejects:
+                            logger.debug("token_filtered", symbol=symbol, reason=f"high_rug_ratio_{rug_ratio}")
                         continue
                 except (ValueError, TypeError):
                     pass
 
             if token.get("gmgn_is_wash_trading"):
-                logger.debug("token_filtered", symbol=symbol, reason="wash_trading_detected")
+                if log_rejects:
+                    logger.debug("token_filtered", symbol=symbol, reason="wash_trading_detected")
                 continue
 
             bundler_rate = token.get("gmgn_bundler_rate")
             if bundler_rate is not None:
                 try:
                     if float(bundler_rate) > 0.3:
-                        logger.debug("token_filtered", symbol=symbol, reason=f"high_bundler_rate_{bundler_rate}")
+                        if log_rejects:
+                            logger.debug("token_filtered", symbol=symbol, reason=f"high_bundler_rate_{bundler_rate}")
                         continue
                 except (ValueError, TypeError):
                     pass
 
             # Symbol sanity check — filter out random gibberish names
-            if not re.match(r'^[A-Za-z0-9$. ]{1,15}$', symbol):
-                logger.debug("token_filtered", symbol=symbol, reason="suspicious_symbol")
+            if not self.SYMBOL_RE.match(symbol):
+                if log_rejects:
+                    logger.debug("token_filtered", symbol=symbol, reason="suspicious_symbol")
                 continue
 
             # Filter tokens with spaces in symbol (often scams like "BVB XMN5")
             if ' ' in symbol.strip():
-                logger.debug("token_filtered", symbol=symbol, reason="multi_word_symbol")
+                if log_rejects:
+                    logger.debug("token_filtered", symbol=symbol, reason="multi_word_symbol")
                 continue
 
             # Filter random-looking symbols (3+ consecutive consonants or digits)
-            if re.match(r'^[a-z0-9]+$', symbol.lower()) and len(symbol) > 4:
-                consonant_runs = re.findall(r'[bcdfghjklmnpqrstvwxyz]{3,}', symbol.lower())
-                digit_runs = re.findall(r'[0-9]{2,}', symbol)
-                if consonant_runs or digit_runs:
-                    logger.debug("token_filtered", symbol=symbol, reason="random_looking_symbol")
+            lowered = symbol.lower()
+            if len(symbol) > 4 and self.ALNUM_LOWER_RE.match(lowered):
+                if self.CONSONANT_RUN_RE.search(lowered) or self.DIGIT_RUN_RE.search(symbol):
+                    if log_rejects:
+                        logger.debug("token_filtered", symbol=symbol, reason="random_looking_symbol")
                     continue
 
             qualifying.append(token)
@@ -812,10 +1083,10 @@ class TokenScanner:
         logger.info("=" * 80)
 
         for i, token in enumerate(tokens, 1):
-            multiplier = token.get("price_multiplier") or 0
-            mcap = token.get("market_cap_usd") or 0
-            volume = token.get("volume_24h_usd") or 0
-            liquidity = token.get("liquidity_usd") or 0
+            multiplier = token["price_multiplier"] or 0
+            mcap = token["market_cap_usd"]
+            volume = token["volume_24h_usd"]
+            liquidity = token["liquidity_usd"]
 
             logger.info(
                 f"#{i}",
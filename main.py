@@ -269,7 +269,7 @@ async def main() -> None:
                 print(f"  + FOMO trader added: {address[:8]}...{address[-4:]} | "
                       f"30D: ${profit_30d:,.0f} | WR: {wr_display}")
 
-            gmgn.close()
+            await gmgn.close()
             print(f"\nDone. Added {added} FOMO trader(s) — all MONITORED + tracked.")
             return
 
@@ -490,7 +490,7 @@ async def main() -> None:
                 wr_display = f"{_f(winrate)*100:.0f}%" if winrate is not None else "-"
                 print(f"  + Added {address[:8]}...{address[-4:]} | 30D: ${profit_30d:,.0f} | WR: {wr_display} | Source: {source.upper()}")
 
-            gmgn.close()
+            await gmgn.close()
             print(f"\nDone. Added {added} wallet(s) — all set to MONITORED.")
             return
 
@@ -509,7 +509,7 @@ async def main() -> None:
                 print("  1. Go to https://gmgn.ai in Chrome")
                 print("  2. DevTools → Application → Cookies → gmgn.ai")
                 print("  3. Copy cf_clearance and __cf_bm values to .env")
-                gmgn.close()
+                await gmgn.close()
                 return
 
             print("Scanning GMGN for smart money wallets...")
@@ -525,7 +525,7 @@ async def main() -> None:
                 max_buys_30d=settings.sm_max_buys_30d,
                 min_sol_balance=settings.sm_min_sol_balance,
             )
-            gmgn.close()
+            await gmgn.close()
 
             if not wallets:
                 print("\nNo wallets passed filters. Try lowering thresholds in .env:")
@@ -918,6 +918,8 @@ async def main() -> None:
     finally:
         # Clean shutdown — always close connections properly
         logger.info("shutting_down")
+        from discovery.gmgn_client import close_shared_clients
+        await close_shared_clients()
         await solana.close()
         await db.close()
         logger.info("bot_stopped")
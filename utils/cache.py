@@ -0,0 +1,139 @@
+"""
+TTL Cache
+=========
+A small in-process cache for API lookups whose answers don't change often.
+
+Why this exists:
+- Discovery passes ask the same questions over and over (the same wallet
+  snippet, the same token) within minutes of each other
+- Every repeat costs a network round trip, and some of them go through
+  Cloudflare
+- Keeping the answer in memory for a while makes a repeat lookup a dict hit
+
+Entries expire after `ttl` seconds. The cache is bounded: once it holds
+`max_size` entries, the least recently used one is evicted (LRU).
+
+Usage:
+    cache = TTLCache(ttl=24 * 60 * 60, max_size=10_000)
+    hit, value = cache.get(key)
+    if not hit:
+        value = await fetch(key)
+        cache.set(key, value)
+
+    # Or let the cache do it — concurrent callers for the same key share
+    # one fetch instead of each firing their own request:
+    value = await cache.get_or_fetch(key, lambda: fetch(key))
+
+SingleFlight is the sharing part on its own, for lookups that should be
+deduplicated while in flight but not cached afterwards.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class SingleFlight:
+    """
+    Collapse concurrent calls for the same key into one.
+    The first caller runs fetch(); anyone asking for the same key while
+    it's running awaits that result instead of firing a duplicate request.
+    Nothing is kept once the call finishes (pair with TTLCache for that).
+    """
+
+    def __init__(self):
+        # key -> future for the call currently running for it
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Run fetch() for key, or join the run already in progress."""
+        pending = self._inflight.get(key)
+        if pending is not None:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The task running the fetch was cancelled, not us — do it ourselves
+                return await self.do(key, fetch)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await fetch()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unshared failure doesn't log "never retrieved"
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            del self._inflight[key]
+
+
+class TTLCache:
+    """LRU-bounded mapping whose entries expire `ttl` seconds after they're set."""
+
+    def __init__(self, ttl: float, max_size: int = 10_000):
+        self.ttl = ttl
+        self.max_size = max_size
+        # key -> (stored_at, value), oldest-used first
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        # Fetches currently running, so concurrent misses share one
+        self._flight = SingleFlight()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        """
+        Look up a key. Returns (hit, value).
+        A (hit, value) pair rather than value-or-None, because None is a
+        legitimate cached answer (e.g. "this address doesn't resolve").
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return False, None
+        stored_at, value = entry
+        if time.monotonic() - stored_at >= self.ttl:
+            del self._data[key]
+            return False, None
+        self._data.move_to_end(key)
+        return True, value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        self._data[key] = (time.monotonic(), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    async def get_or_fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the cached value for key, or await fetch() and cache its result.
+        If a fetch for the same key is already running, wait for that one
+        instead of starting another. Empty results ({} / [] / None) are
+        returned but not cached — the clients return those on failure, and
+        a failure shouldn't stick for the whole TTL.
+        """
+        hit, value = self.get(key)
+        if hit:
+            return value
+
+        async def fetch_and_store() -> Any:
+            value = await fetch()
+            if value:
+                self.set(key, value)
+            return value
+
+        return await self._flight.do(key, fetch_and_store)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._data.clear()
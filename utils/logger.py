@@ -51,6 +51,10 @@ def setup_logging(log_level: str = "INFO", log_dir: str | None = None) -> None:
     # Configure structlog for clean, colorful terminal output
     structlog.configure(
         processors=[
+            # Drop events below the configured level before any formatting
+            # work — without this, every logger.debug() call still gets
+            # timestamped and rendered, only to be discarded by stdlib logging
+            structlog.stdlib.filter_by_level,
             # Add log level (INFO, WARNING, etc.)
             structlog.stdlib.add_log_level,
             # Add timestamp
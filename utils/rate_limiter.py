@@ -0,0 +1,158 @@
+"""
+Rate Limiter
+============
+A token-bucket rate limiter for asyncio API clients.
+
+Why this exists:
+- The APIs we poll publish request budgets (e.g. GeckoTerminal: 30/minute)
+- A fixed sleep between requests is both too slow (it waits even when
+  there's budget left) and wrong under concurrency (two coroutines each
+  sleeping 1s still fire 2 requests per second together)
+- A bucket shared by every request from a client enforces the budget
+  no matter how many coroutines are calling it
+
+How it works:
+- The bucket holds up to `max_rate` tokens and refills continuously at
+  `max_rate` per `period` seconds
+- Each request takes one token; if none are left, it waits just long
+  enough for the next one to drip in
+- Waiters are served in arrival order
+
+Usage:
+    limiter = AsyncRateLimiter(30, 60)   # 30 requests per minute
+    async with limiter:
+        await session.get(...)
+
+AdaptiveConcurrency caps how many requests are in flight at once and
+tunes that cap AIMD-style (like TCP congestion control): a little wider
+after every success, halved after every 429/5xx/error.
+
+parse_retry_after() reads a 429/503 Retry-After header, so a client can
+wait exactly as long as the server asked instead of guessing.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+
+class AsyncRateLimiter:
+    """Token bucket: at most `max_rate` acquisitions per `period` seconds."""
+
+    def __init__(self, max_rate: float, period: float = 1.0):
+        self.max_rate = max_rate
+        self.period = period
+        self._rate_per_sec = max_rate / period
+        # Start full so the first burst goes out immediately
+        self._tokens = float(max_rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def set_rate(self, max_rate: float) -> None:
+        """
+        Change the rate on the fly (used by clients that adapt to 429s).
+        Tokens already in the bucket are kept, capped at the new size.
+        """
+        self._refill()
+        self.max_rate = max_rate
+        self._rate_per_sec = max_rate / self.period
+        self._tokens = min(self._tokens, max_rate)
+
+    def _refill(self) -> None:
+        """Add the tokens that have dripped in since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(self.max_rate, self._tokens + (now - self._updated) * self._rate_per_sec)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available, then take it."""
+        # The lock queues waiters so they're served first-come first-served
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._rate_per_sec)
+                self._refill()
+            self._tokens -= 1
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+
+class AdaptiveConcurrency:
+    """
+    In-flight request cap that adapts to how the server is coping.
+    increase() adds `alpha` to the cap (up to `maximum`); decrease()
+    multiplies it by `beta` (down to `minimum`). Requests enter with
+    `async with`, and wait while the whole-number part of the cap is
+    already in flight. Changes take effect as running requests finish.
+    """
+
+    def __init__(
+        self,
+        initial: float = 4,
+        minimum: float = 1,
+        maximum: float = 32,
+        alpha: float = 0.5,
+        beta: float = 0.5,
+    ):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.alpha = alpha
+        self.beta = beta
+        self._limit = float(initial)
+        self._in_flight = 0
+        self._cond = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current cap on requests in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def __aenter__(self) -> "AdaptiveConcurrency":
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < int(self._limit))
+            self._in_flight += 1
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        async with self._cond:
+            self._in_flight -= 1
+            # Wake everyone: the cap may have grown by more than one slot
+            # since the last release, and waiters re-check it anyway
+            self._cond.notify_all()
+
+    def increase(self) -> None:
+        """Additive increase — call after a healthy response."""
+        self._limit = min(self.maximum, self._limit + self.alpha)
+
+    def decrease(self) -> None:
+        """Multiplicative decrease — call after a 429, 5xx or error."""
+        self._limit = max(self.minimum, self._limit * self.beta)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Seconds to wait from a Retry-After header, or None if absent/unparseable.
+    The header is either delta-seconds ("120") or an HTTP date.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
@@ -16,6 +16,8 @@ Why Helius instead of public RPC?
 - Worth every penny for a trading bot
 """
 
+import asyncio
+
 import base58
 import aiohttp
 from solders.keypair import Keypair
@@ -25,6 +27,9 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Helius /v0/transactions parses at most this many signatures per request
+HELIUS_PARSE_BATCH = 100
+
 
 class SolanaClient:
     """
@@ -60,7 +65,11 @@ class SolanaClient:
 
     async def initialize(self) -> None:
         """Create the HTTP session for making API calls."""
-        self.session = aiohttp.ClientSession()
+        # One keep-alive pool for every Helius call — parallel parse batches
+        # reuse warm TLS connections instead of handshaking each time
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=16, keepalive_timeout=60)
+        )
         logger.info("solana_client_initialized", rpc="helius")
 
     async def close(self) -> None:
@@ -156,7 +165,21 @@ class SolanaClient:
         them into clear events like "Wallet X swapped 1 SOL for 1000 PEPE".
 
         This is one of the main reasons we use Helius.
+
+        Lists longer than HELIUS_PARSE_BATCH are split into batches that are
+        sent in parallel; results come back in the original order.
         """
+        if len(signatures) <= HELIUS_PARSE_BATCH:
+            return await self._parse_transaction_batch(signatures)
+
+        batches = await asyncio.gather(*(
+            self._parse_transaction_batch(signatures[i:i + HELIUS_PARSE_BATCH])
+            for i in range(0, len(signatures), HELIUS_PARSE_BATCH)
+        ))
+        return [tx for batch in batches for tx in batch]
+
+    async def _parse_transaction_batch(self, signatures: list[str]) -> list[dict]:
+        """Parse one batch (up to HELIUS_PARSE_BATCH signatures) through Helius."""
         url = f"{self.helius_api_url}/transactions?api-key={self.helius_api_key}"
         payload = {"transactions": signatures}
 